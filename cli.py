@@ -0,0 +1,37 @@
+"""Drill words in a terminal.
+
+Unlike `main.py` this entry point never imports Qt, so it starts quickly
+and works on machines without a display.
+"""
+
+from pathlib import Path
+import argparse
+import sys
+
+sys.path.append(str(Path(__file__).parent))
+from utils.database_utils import load_dataset
+from utils.terminal_utils import TerminalDrill
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Drill english words in a terminal.')
+    parser.add_argument('dataset', type=Path, nargs='?',
+                        default=Path(__file__).parent / 'words.json',
+                        help='A path to the dataset file or '
+                             'a sharded dataset directory.')
+    parser.add_argument('--deck', type=str, default=None,
+                        help='A tags query to drill only matching words, '
+                             'e.g. "ml & !deck:archive".')
+    args = parser.parse_args()
+
+    dataset = load_dataset(args.dataset)
+    try:
+        drill = TerminalDrill(dataset, args.dataset, args.deck)
+    except ValueError as error:
+        parser.error(str(error))
+    drill.run()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,18 +1,52 @@
+import time
+_START_TIME = time.perf_counter()
+
 from pathlib import Path
+import json
+import os
 import sys
 
-from PySide6.QtWidgets import QApplication
-
 sys.path.append(Path(__file__).parent)
-from utils.window_modules import MainWindow
-from utils.database_utils import Dataset
+
+# Setting this environment variable makes the application print its startup
+# timings as a json line and exit right after the first sample is shown.
+# It is used by `scripts/startup_benchmark.py`.
+STARTUP_PROBE_ENV = 'ENG_APP_STARTUP_PROBE'
+
+
+def _report_startup(timings):
+    """Print startup timings and exit without touching the dataset file."""
+    timings['first_sample'] = time.perf_counter() - _START_TIME
+    timings['wall_clock'] = time.time()
+    print(json.dumps(timings), flush=True)
+    # `closeEvent` would save the dataset, so the probe leaves immediately.
+    os._exit(0)
 
 
 def main():
+    timings = {}
+    # Qt is heavy to import, so it is imported only when the application
+    # is actually started rather than when this module is imported.
+    from PySide6.QtCore import QTimer
+    from PySide6.QtWidgets import QApplication
+    from utils.window_modules import MainWindow
+    timings['import_qt'] = time.perf_counter() - _START_TIME
+    from utils.database_utils import load_dataset
+
     application = QApplication()
-    dataset = Dataset('words.json')
+    timings['qt_application'] = time.perf_counter() - _START_TIME
+    if len(sys.argv) > 1:
+        dataset_path = Path(sys.argv[1])
+    else:
+        dataset_path = Path(sys.argv[0]).parent / 'words.json'
+    dataset = load_dataset(dataset_path)
+    timings['dataset_load'] = time.perf_counter() - _START_TIME
     main_window = MainWindow(dataset)
+    timings['main_window'] = time.perf_counter() - _START_TIME
     main_window.show()
+    if os.environ.get(STARTUP_PROBE_ENV):
+        # Fires on the first event loop iteration, after the first paint
+        QTimer.singleShot(0, lambda: _report_startup(timings))
     application.exec()
 
 
@@ -0,0 +1,101 @@
+"""Compare size, load time and save time of the dataset file formats.
+
+A synthetic dataset is built by repeating the samples of `words.json` with
+unique words. It is saved and loaded in every supported format and also
+with the original `json.dump(..., indent=4)` call for reference.
+
+    python scripts/dataset_format_benchmark.py --samples 100000
+"""
+
+from pathlib import Path
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append(str(Path(__file__).parents[1]))
+from utils.database_utils.file_io import read_samples, write_samples
+
+
+PROJECT_DIR = Path(__file__).parents[1]
+FORMATS = ['.json', '.json.gz', '.json.bz2', '.json.xz']
+
+
+def make_samples(n_samples: int):
+    """Build a list of synthetic samples based on `words.json`.
+
+    Example sentences are shuffled tokens of the real examples, so the data
+    does not repeat and compresses no better than a real dictionary.
+    """
+    rng = random.Random(0)
+    base_samples = read_samples(PROJECT_DIR / 'words.json')
+    tokens = {'example_eng': [], 'example_rus': []}
+    for sample in base_samples:
+        for example in sample['examples']:
+            for key, key_tokens in tokens.items():
+                key_tokens.extend(example[key].split())
+
+    samples = []
+    for i in range(n_samples):
+        base_sample = base_samples[i % len(base_samples)]
+        examples = []
+        for example in base_sample['examples']:
+            examples.append({
+                key: ' '.join(rng.choices(key_tokens,
+                                          k=len(example[key].split())))
+                for key, key_tokens in tokens.items()})
+        samples.append({'word': f'{base_sample["word"]}{i:07d}',
+                        'translates': base_sample['translates'],
+                        'examples': examples})
+    return samples
+
+
+def measure(function, *args):
+    """Call a function and return its result and duration in seconds."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compare dataset file formats.')
+    parser.add_argument('--samples', type=int, default=100000,
+                        help='A number of samples in the synthetic dataset.')
+    args = parser.parse_args()
+
+    samples = make_samples(args.samples)
+    print(f'{args.samples} samples')
+    print(f'{"format":<22}{"size, MB":>10}{"save, s":>10}{"load, s":>10}')
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+
+        def dump_indented(path):
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(samples, f, sort_keys=False,
+                          indent=4, ensure_ascii=False)
+
+        def load_indented(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.loads(f.read())
+
+        cases = [('json.dump (original)', '.json',
+                  dump_indented, load_indented)]
+        cases += [(suffix, suffix,
+                   lambda path: write_samples(samples, path), read_samples)
+                  for suffix in FORMATS]
+        for name, suffix, save, load in cases:
+            path = tmp_dir / f'words{suffix}'
+            _, save_time = measure(save, path)
+            loaded, load_time = measure(load, path)
+            assert len(loaded) == len(samples)
+            size = path.stat().st_size / 2 ** 20
+            print(f'{name:<22}{size:>10.1f}{save_time:>10.2f}'
+                  f'{load_time:>10.2f}')
+            path.unlink()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""Report or remove near-duplicate examples of a dataset.
+
+    python scripts/dedup_examples.py words.json --threshold 0.8
+    python scripts/dedup_examples.py words.json --remove --cross-sample
+"""
+
+from pathlib import Path
+import argparse
+import sys
+import time
+
+sys.path.append(str(Path(__file__).parents[1]))
+from utils.database_utils import load_dataset
+from utils.database_utils.example_dedup import (
+    find_duplicate_clusters, iter_redundant_examples, remove_duplicates)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Find near-duplicate examples of a dataset.')
+    parser.add_argument('dataset', type=Path,
+                        help='A path to the dataset.')
+    parser.add_argument('--threshold', type=float, default=0.8,
+                        help='A minimal Jaccard similarity of duplicates.')
+    parser.add_argument('--remove', action='store_true',
+                        help='Remove redundant duplicates and save '
+                             'the dataset.')
+    parser.add_argument('--cross-sample', action='store_true',
+                        help='Treat duplicates in different samples '
+                             'as redundant too.')
+    args = parser.parse_args()
+
+    dataset = load_dataset(args.dataset)
+    start = time.perf_counter()
+    clusters = find_duplicate_clusters(dataset, args.threshold)
+    duration = time.perf_counter() - start
+
+    for cluster in clusters:
+        print('-' * 40)
+        for word, example_idx in cluster:
+            example = dataset[word]['examples'][example_idx]
+            print(f'{word} #{example_idx}: {example["example_eng"]}')
+    redundant = list(iter_redundant_examples(
+        dataset, clusters, args.cross_sample, args.threshold))
+    print(f'\n{len(clusters)} clusters, {len(redundant)} redundant '
+          f'examples, found in {duration:.2f} s')
+
+    if args.remove:
+        removed = remove_duplicates(dataset, clusters, args.cross_sample,
+                                    args.threshold)
+        dataset.save_dataset(dataset.dataset_path)
+        print(f'{removed} examples removed')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""Export a dataset to csv, tsv or an Anki-importable text file.
+
+    python scripts/export_dataset.py words.json words.csv
+    python scripts/export_dataset.py words.json anki.txt --rows example
+    python scripts/export_dataset.py shards_dir words.tsv --separator "; "
+
+The dataset is streamed from the disk, it is never loaded as a whole.
+"""
+
+from pathlib import Path
+import argparse
+import sys
+import time
+
+sys.path.append(str(Path(__file__).parents[1]))
+from utils.database_utils import (
+    EXPORT_FORMATS, export_samples, iter_dataset_samples)
+from utils.database_utils.export import ROW_MODES
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Export a dataset to a format of another tool.')
+    parser.add_argument('dataset', type=Path,
+                        help='A path to the dataset file or directory.')
+    parser.add_argument('output', type=Path,
+                        help='A path of the exported file.')
+    parser.add_argument('--format', choices=EXPORT_FORMATS,
+                        help='The export format. By default is guessed by '
+                             'the output extension: .csv, .tsv or .txt '
+                             'for anki.')
+    parser.add_argument('--rows', choices=ROW_MODES, default='sample',
+                        help='Write a row per sample or per example.')
+    parser.add_argument('--separator', default=', ',
+                        help='A string to join translates with.')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        count = export_samples(iter_dataset_samples(args.dataset),
+                               args.output, args.format, args.rows,
+                               args.separator)
+    except ValueError as error:
+        parser.error(str(error))
+    duration = time.perf_counter() - start
+    print(f'{count} rows written to {args.output} in {duration:.2f} s')
+
+
+if __name__ == '__main__':
+    main()
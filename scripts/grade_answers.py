@@ -0,0 +1,67 @@
+"""Grade a session of typed answers offline.
+
+The session is a csv (or tsv for a `.tsv` file) file with `word` and
+`answer` columns. Every answer is graded against the translates of the word
+in the dataset and the grades are written to the output csv file with
+`correct`, `distance` and `expected` columns added. The session is read
+row by row, words that are not in the dataset get empty grades.
+
+    python scripts/grade_answers.py session.csv graded.csv --dataset words.json
+"""
+
+from pathlib import Path
+import argparse
+import csv
+import sys
+import time
+
+sys.path.append(str(Path(__file__).parents[1]))
+from utils.database_utils import grade_answer, load_dataset
+
+
+PROJECT_DIR = Path(__file__).parents[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Grade a session of typed answers.')
+    parser.add_argument('session', type=Path,
+                        help='A csv file with "word" and "answer" columns.')
+    parser.add_argument('output', type=Path,
+                        help='A csv file for the graded answers.')
+    parser.add_argument('--dataset', type=Path,
+                        default=PROJECT_DIR / 'words.json',
+                        help='A path to the dataset.')
+    parser.add_argument('--max-errors', type=int, default=None,
+                        help='A number of allowed typos. By default it '
+                             'depends on the length of a translate.')
+    args = parser.parse_args()
+
+    dataset = load_dataset(args.dataset)
+    delimiter = '\t' if args.session.suffix == '.tsv' else ','
+    start = time.perf_counter()
+    with open(args.session, 'r', encoding='utf-8', newline='') as src, \
+            open(args.output, 'w', encoding='utf-8', newline='') as dst:
+        writer = csv.writer(dst)
+        writer.writerow(['word', 'answer', 'correct', 'distance', 'expected'])
+        n_rows = n_correct = n_unknown = 0
+        for row in csv.DictReader(src, delimiter=delimiter):
+            n_rows += 1
+            word, answer = row['word'], row['answer']
+            if word not in dataset:
+                # Unknown words are kept in the output with empty grades
+                writer.writerow([word, answer, '', '', ''])
+                n_unknown += 1
+                continue
+            grade = grade_answer(answer, dataset[word]['translates'],
+                                 args.max_errors)
+            writer.writerow([word, answer, int(grade.correct),
+                             grade.distance, grade.expected])
+            n_correct += grade.correct
+
+    print(f'{n_correct}/{n_rows} correct, {n_unknown} words not in '
+          f'the dataset, graded in {time.perf_counter() - start:.2f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""Rank the words of a dataset by their corpus frequency.
+
+    python scripts/rank_words.py words.json
+    python scripts/rank_words.py words.json --frequency-list en_50k.txt
+
+The ranks are saved next to the dataset (words.json.freq) and let the app
+show the most frequent words first. Rank the dataset again after adding
+words to it.
+"""
+
+from pathlib import Path
+import argparse
+import sys
+import time
+
+sys.path.append(str(Path(__file__).parents[1]))
+from utils.database_utils import load_dataset, rank_dataset
+from utils.database_utils.frequency_ranks import frequency_path
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Rank the words of a dataset by frequency.')
+    parser.add_argument('dataset', type=Path,
+                        help='A path to the dataset file or directory.')
+    parser.add_argument('--frequency-list', type=Path,
+                        help='A file with "word count" lines to merge with '
+                             'the counts of the dataset examples.')
+    parser.add_argument('--top', type=int, default=10,
+                        help='A number of the most frequent words to print.')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        ranks = rank_dataset(args.dataset, args.frequency_list)
+    except ValueError as error:
+        parser.error(str(error))
+    duration = time.perf_counter() - start
+    print(f'{len(ranks)} words ranked in {duration:.2f} s, saved to '
+          f'{frequency_path(args.dataset)}')
+
+    dataset = load_dataset(args.dataset)
+    for rank, index in enumerate(ranks.order[:args.top], 1):
+        print(f'{rank:>4}. {dataset[index]["word"]}')
+
+
+if __name__ == '__main__':
+    main()
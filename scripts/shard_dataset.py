@@ -0,0 +1,33 @@
+"""Convert a dataset file to a directory of shards.
+
+    python scripts/shard_dataset.py words.json words_shards --shard-size 1000
+"""
+
+from pathlib import Path
+import argparse
+import sys
+
+sys.path.append(str(Path(__file__).parents[1]))
+from utils.database_utils import Dataset, make_shards
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Split a dataset file into a directory of shards.')
+    parser.add_argument('dataset', type=Path,
+                        help='A path to the dataset file.')
+    parser.add_argument('save_dir', type=Path,
+                        help='A directory for the shards and the manifest.')
+    parser.add_argument('--shard-size', type=int, default=1000,
+                        help='A number of samples in one shard.')
+    parser.add_argument('--suffix', type=str, default='.json',
+                        help='An extension of the shard files, '
+                             'e.g. .json.gz for compressed shards.')
+    args = parser.parse_args()
+
+    make_shards(Dataset(args.dataset), args.save_dir, args.shard_size,
+                args.suffix)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""Measure the startup time of the application.
+
+The application is started several times with the startup probe enabled
+(see `STARTUP_PROBE_ENV` in `main.py`). Every run reports when Qt was
+imported, when the dataset was loaded and when the first sample was shown.
+The script prints the median and the best value of every phase.
+
+Both a plain CPython launch and a Nuitka build can be measured:
+    python scripts/startup_benchmark.py --runs 10
+    python -m nuitka --follow-imports main.py --remove-output
+    python scripts/startup_benchmark.py --runs 10 --nuitka-binary ./main.bin
+
+Use `--offscreen` on machines without a display.
+"""
+
+from pathlib import Path
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+sys.path.append(str(Path(__file__).parents[1]))
+from main import STARTUP_PROBE_ENV
+
+
+PROJECT_DIR = Path(__file__).parents[1]
+PHASES = ['import_qt', 'qt_application', 'dataset_load', 'main_window',
+          'first_sample']
+
+
+def run_once(command: List[str], offscreen: bool) -> Dict[str, float]:
+    """Start the application once and collect its startup timings.
+
+    Parameters
+    ----------
+    command : List[str]
+        A command that starts the application.
+    offscreen : bool
+        Whether to use the offscreen Qt platform.
+
+    Returns
+    -------
+    Dict[str, float]
+        Durations of the startup phases in seconds. The `process` entry
+        is the time from spawning the process till the first sample.
+    """
+    env = dict(os.environ)
+    env[STARTUP_PROBE_ENV] = '1'
+    if offscreen:
+        env['QT_QPA_PLATFORM'] = 'offscreen'
+    spawn_time = time.time()
+    result = subprocess.run(command, cwd=PROJECT_DIR, env=env,
+                            capture_output=True, text=True, check=True)
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+
+    # Convert cumulative timestamps to durations of the separate phases
+    durations = {}
+    previous = 0.0
+    for phase in PHASES:
+        durations[phase] = timings[phase] - previous
+        previous = timings[phase]
+    durations['process'] = timings['wall_clock'] - spawn_time
+    return durations
+
+
+def benchmark(name: str, command: List[str], runs: int, offscreen: bool):
+    """Run the application several times and print a summary table."""
+    results = [run_once(command, offscreen) for _ in range(runs)]
+    print(f'{name} ({runs} runs), ms')
+    print(f'{"phase":<16}{"median":>10}{"best":>10}')
+    for phase in PHASES + ['process']:
+        values = [result[phase] * 1000 for result in results]
+        print(f'{phase:<16}{statistics.median(values):>10.1f}'
+              f'{min(values):>10.1f}')
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Measure the startup time of the application.')
+    parser.add_argument('--runs', type=int, default=5,
+                        help='A number of launches for each target.')
+    parser.add_argument('--nuitka-binary', type=Path, default=None,
+                        help='A path to the Nuitka-compiled application.')
+    parser.add_argument('--offscreen', action='store_true',
+                        help='Use the offscreen Qt platform.')
+    args = parser.parse_args()
+
+    benchmark('CPython', [sys.executable, str(PROJECT_DIR / 'main.py')],
+              args.runs, args.offscreen)
+    if args.nuitka_binary is not None:
+        benchmark('Nuitka', [str(args.nuitka_binary.resolve())],
+                  args.runs, args.offscreen)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""Add tags to words of a dataset.
+
+The words are given as arguments or in a file with one word per line.
+
+    python scripts/tag_words.py words.json --tags ml week-42 --words loss bias
+    python scripts/tag_words.py words.json --tags papers --words-file new.txt
+"""
+
+from pathlib import Path
+import argparse
+import sys
+
+sys.path.append(str(Path(__file__).parents[1]))
+from utils.database_utils import load_dataset, validate_label
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Add tags to words of a dataset.')
+    parser.add_argument('dataset', type=Path,
+                        help='A path to the dataset.')
+    parser.add_argument('--tags', nargs='+', required=True,
+                        help='The tags to add.')
+    parser.add_argument('--words', nargs='+', default=[],
+                        help='The words to tag.')
+    parser.add_argument('--words-file', type=Path, default=None,
+                        help='A file with one word per line to tag.')
+    args = parser.parse_args()
+
+    try:
+        tags = [validate_label(tag) for tag in args.tags]
+    except ValueError as error:
+        parser.error(str(error))
+    words = [word.strip().lower() for word in args.words]
+    if args.words_file is not None:
+        with open(args.words_file, 'r', encoding='utf-8') as file:
+            words.extend(line.strip().lower() for line in file
+                         if line.strip())
+
+    dataset = load_dataset(args.dataset)
+    n_tagged = n_missing = 0
+    for word in words:
+        if word not in dataset:
+            n_missing += 1
+            continue
+        dataset.add_tags(word, tags)
+        n_tagged += 1
+    if n_tagged:
+        dataset.save_dataset(dataset.dataset_path)
+    print(f'{n_tagged} words tagged, {n_missing} not in the dataset')
+
+
+if __name__ == '__main__':
+    main()
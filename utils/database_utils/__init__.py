@@ -4,3 +4,20 @@ A Package contains tools for working with dataset's data.
 
 from utils.database_utils.dataset import (  # noqa
     Dataset, sample_type, example_dict)
+from utils.database_utils.sharded_dataset import (  # noqa
+    ShardedDataset, make_shards, load_dataset, iter_dataset_samples)
+from utils.database_utils.file_io import (  # noqa
+    iter_samples, read_samples, write_samples)
+from utils.database_utils.deck_index import (  # noqa
+    DeckIndex, parse_deck_query, parse_tags, validate_label)
+from utils.database_utils.answer_grader import (  # noqa
+    AnswerGrade, grade_answer, grade_answers)
+from utils.database_utils.example_dedup import (  # noqa
+    ExampleRef, find_duplicate_clusters, remove_duplicates)
+from utils.database_utils.cloze import ClozeIndex  # noqa
+from utils.database_utils.dataset_view import DatasetView  # noqa
+from utils.database_utils.export import (  # noqa
+    EXPORT_FORMATS, export_samples)
+from utils.database_utils.frequency_ranks import FrequencyRanks  # noqa
+from utils.database_utils.frequency import (  # noqa
+    count_tokens, rank_dataset, read_frequency_list)
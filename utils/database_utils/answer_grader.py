@@ -0,0 +1,221 @@
+"""A module for grading typed translations with typo tolerance.
+
+An answer and every expected translate are normalized (Unicode NFKC,
+case folding, `ё` -> `е`, punctuation removal, single spaces) and compared
+by Levenshtein distance. The answer is correct if the distance to the
+nearest translate is within the allowed number of typos, which grows with
+the translate's length (see `allowed_errors`).
+
+The distance is computed by Myers' bit-parallel algorithm (in Hyyrö's
+formulation for Levenshtein distance). The whole column of the dynamic
+programming table is kept in the bits of two python integers, so one text
+character costs a few integer operations regardless of the translate's
+length. Bitmasks of the translates are cached, which makes grading big
+batches of answers (see `grade_answers`) cheap.
+"""
+
+from functools import lru_cache
+import re
+import sys
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple
+import unicodedata
+
+
+NON_WORD_CHARS = re.compile(r'[^\w\s-]+')
+SPACES = re.compile(r'[\s_-]+')
+
+
+class AnswerGrade(NamedTuple):
+    """A result of grading one answer."""
+    correct: bool
+    # The edit distance to the nearest translate
+    distance: int
+    # The nearest translate as it is written in the dataset
+    expected: str
+
+
+def normalize_answer(text: str) -> str:
+    """Normalize a text for comparison.
+
+    Parameters
+    ----------
+    text : str
+        The text to normalize.
+
+    Returns
+    -------
+    str
+        The case folded text without punctuation and extra spaces.
+    """
+    text = unicodedata.normalize('NFKC', text).casefold().replace('ё', 'е')
+    text = NON_WORD_CHARS.sub('', text)
+    return SPACES.sub(' ', text).strip()
+
+
+def allowed_errors(length: int) -> int:
+    """Get a number of typos allowed for a translate of a given length.
+
+    Parameters
+    ----------
+    length : int
+        The length of the normalized translate.
+
+    Returns
+    -------
+    int
+        0 for up to 3 characters, 1 for up to 7 and 2 for longer ones.
+    """
+    if length <= 3:
+        return 0
+    if length <= 7:
+        return 1
+    return 2
+
+
+@lru_cache(maxsize=2 ** 16)
+def compile_pattern(pattern: str) -> Tuple[Dict[str, int], int]:
+    """Get the character bitmasks of a pattern for `edit_distance`.
+
+    Parameters
+    ----------
+    pattern : str
+        The normalized pattern.
+
+    Returns
+    -------
+    Tuple[Dict[str, int], int]
+        A dict with a bitmask of the pattern positions for every character
+        of the pattern and the pattern's length.
+    """
+    masks = {}
+    for i, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | 1 << i
+    return masks, len(pattern)
+
+
+def edit_distance(pattern: str, text: str, max_distance: int = None) -> int:
+    """Compute Levenshtein distance with the bit-parallel algorithm.
+
+    Parameters
+    ----------
+    pattern : str
+        The first string. Its bitmasks are cached, so it should be the one
+        that repeats, e.g. the expected translate.
+    text : str
+        The second string.
+    max_distance : int, optional
+        If given, the computation stops as soon as the distance is known
+        to exceed it, and `max_distance + 1` is returned.
+
+    Returns
+    -------
+    int
+        The distance.
+    """
+    masks, length = compile_pattern(pattern)
+    if max_distance is not None and abs(length - len(text)) > max_distance:
+        return max_distance + 1
+    if length == 0:
+        return len(text)
+
+    full = (1 << length) - 1
+    last = 1 << (length - 1)
+    # Bits of positive and negative vertical differences of the column
+    positive = full
+    negative = 0
+    distance = length
+    remaining = len(text)
+    for char in text:
+        equal = masks.get(char, 0)
+        vertical = equal | negative
+        horizontal = (((equal & positive) + positive) ^ positive) | equal
+        horizontal_positive = negative | ~(horizontal | positive) & full
+        horizontal_negative = positive & horizontal
+        if horizontal_positive & last:
+            distance += 1
+        elif horizontal_negative & last:
+            distance -= 1
+        horizontal_positive = (horizontal_positive << 1 | 1) & full
+        horizontal_negative = (horizontal_negative << 1) & full
+        positive = (horizontal_negative |
+                    ~(vertical | horizontal_positive) & full)
+        negative = horizontal_positive & vertical
+
+        remaining -= 1
+        # Every remaining character may decrease the distance by one at most
+        if max_distance is not None and distance - remaining > max_distance:
+            return max_distance + 1
+    return distance
+
+
+def grade_answer(
+    answer: str,
+    translates: List[str],
+    max_errors: int = None
+) -> AnswerGrade:
+    """Grade a typed answer against the translates of a sample.
+
+    Parameters
+    ----------
+    answer : str
+        The typed answer.
+    translates : List[str]
+        The expected translates.
+    max_errors : int, optional
+        A number of allowed typos. By default depends on the length of
+        every translate (see `allowed_errors`).
+
+    Returns
+    -------
+    AnswerGrade
+        Whether the answer is correct, the distance to the nearest
+        translate and this translate.
+    """
+    answer = normalize_answer(answer)
+    if not translates:
+        return AnswerGrade(False, len(answer), '')
+    best = AnswerGrade(False, sys.maxsize, translates[0])
+    for translate in translates:
+        expected = normalize_translate(translate)
+        allowed = (allowed_errors(len(expected)) if max_errors is None
+                   else max_errors)
+        if answer == expected:
+            return AnswerGrade(True, 0, translate)
+        # Only distances below the best one found so far matter
+        bound = max(allowed, best.distance - 1)
+        distance = edit_distance(expected, answer, bound)
+        if distance <= allowed and (not best.correct or
+                                    distance < best.distance):
+            best = AnswerGrade(True, distance, translate)
+        elif not best.correct and distance < best.distance:
+            best = AnswerGrade(False, distance, translate)
+    return best
+
+
+@lru_cache(maxsize=2 ** 16)
+def normalize_translate(translate: str) -> str:
+    """`normalize_answer` cached for translates that repeat across answers."""
+    return normalize_answer(translate)
+
+
+def grade_answers(
+    answers: Iterable[Tuple[str, List[str]]],
+    max_errors: int = None
+) -> Iterator[AnswerGrade]:
+    """Grade a batch of answers lazily.
+
+    Parameters
+    ----------
+    answers : Iterable[Tuple[str, List[str]]]
+        Pairs of a typed answer and the expected translates.
+    max_errors : int, optional
+        A number of allowed typos. By default depends on the length of
+        every translate (see `allowed_errors`).
+
+    Yields
+    ------
+    AnswerGrade
+        The grade of the next answer.
+    """
+    for answer, translates in answers:
+        yield grade_answer(answer, translates, max_errors)
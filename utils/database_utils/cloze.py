@@ -0,0 +1,217 @@
+"""A module for cloze (fill-in-the-blank) cards.
+
+A cloze card shows an english example with the sample's word blanked out.
+The word may appear in an inflected form, e.g. "acquire" -> "acquired",
+so the example is tokenized and every token is compared with the forms of
+the word (see `word_forms`). Only regular inflections are generated, so
+irregular forms like "took" for "take" are not found.
+
+`ClozeIndex` finds the target spans of every example once and keeps them
+as compact arrays of character offsets, so rendering a card is just
+slicing its text. The index listens to its dataset and forgets the spans
+of a sample when the sample is changed.
+"""
+
+from array import array
+from functools import lru_cache
+import re
+from typing import Dict, FrozenSet, List, Tuple
+
+from utils.database_utils.dataset import Dataset
+
+
+TOKEN = re.compile(r"\w+(?:['’]\w+)*")
+VOWELS = set('aeiou')
+BLANK = '_____'
+
+
+@lru_cache(maxsize=2 ** 16)
+def tokenize(text: str) -> Tuple[Tuple[int, int], ...]:
+    """Get character spans of the words of a text.
+
+    Parameters
+    ----------
+    text : str
+        The text.
+
+    Returns
+    -------
+    Tuple[Tuple[int, int], ...]
+        Start and end offsets of every word.
+    """
+    return tuple(match.span() for match in TOKEN.finditer(text))
+
+
+def _inflections(lemma: str) -> List[str]:
+    """Get regular inflected forms of an english lemma."""
+    forms = [lemma, lemma + 's', lemma + 'es', lemma + 'ed', lemma + 'd',
+             lemma + 'ing', lemma + 'er', lemma + 'est']
+    if lemma.endswith('e'):
+        forms.append(lemma[:-1] + 'ing')
+    if lemma.endswith('ie'):
+        forms.append(lemma[:-2] + 'ying')
+    if len(lemma) > 1 and lemma.endswith('y') and lemma[-2] not in VOWELS:
+        forms += [lemma[:-1] + 'ies', lemma[:-1] + 'ied', lemma[:-1] + 'ier']
+    if (len(lemma) > 2 and lemma[-1] not in VOWELS | set('wxy') and
+            lemma[-2] in VOWELS and lemma[-3] not in VOWELS):
+        # Doubled final consonant: stop -> stopped, stopping
+        forms += [lemma + lemma[-1] + suffix for suffix in ('ed', 'ing', 'er')]
+    return forms
+
+
+def _lemmas(word: str) -> List[str]:
+    """Guess possible lemmas of a word that may itself be inflected."""
+    lemmas = [word]
+    for suffix, replacements in (('ied', ['y']), ('ies', ['y']),
+                                 ('ing', ['', 'e']), ('ed', ['', 'e']),
+                                 ('es', ['']), ('s', [''])):
+        stem = word[:-len(suffix)]
+        if word.endswith(suffix) and len(stem) >= 3:
+            lemmas += [stem + replacement for replacement in replacements]
+            if len(stem) > 3 and stem[-1] == stem[-2]:
+                # Doubled final consonant: emitted -> emit
+                lemmas.append(stem[:-1])
+            break
+    return lemmas
+
+
+@lru_cache(maxsize=2 ** 16)
+def word_forms(word: str) -> FrozenSet[str]:
+    """Get case folded forms of a word to search in examples.
+
+    Parameters
+    ----------
+    word : str
+        The word, maybe inflected itself.
+
+    Returns
+    -------
+    FrozenSet[str]
+        The word and its regular inflections.
+    """
+    word = word.casefold()
+    forms = set()
+    for lemma in _lemmas(word):
+        forms.update(_inflections(lemma))
+    return frozenset(forms)
+
+
+def find_target_spans(word: str, text: str) -> array:
+    """Find occurrences of a word or a phrase in a text.
+
+    A phrase matches consecutive tokens. Its first and last words may be
+    inflected, so both "take off" -> "takes off" and "data set" ->
+    "data sets" are found, the words between them must match exactly.
+
+    Parameters
+    ----------
+    word : str
+        The word or the phrase.
+    text : str
+        The text to search in.
+
+    Returns
+    -------
+    array
+        Start and end offsets of every occurrence one after another.
+    """
+    parts = word.casefold().split()
+    if not parts:
+        return array('I')
+    part_forms = [word_forms(part) if j in (0, len(parts) - 1)
+                  else frozenset([part]) for j, part in enumerate(parts)]
+    tokens = tokenize(text)
+    spans = array('I')
+    i = 0
+    while i + len(parts) <= len(tokens):
+        window = tokens[i:i + len(parts)]
+        if all(text[start:end].casefold() in forms
+               for (start, end), forms in zip(window, part_forms)):
+            spans.extend((window[0][0], window[-1][1]))
+            i += len(parts)
+        else:
+            i += 1
+    return spans
+
+
+class ClozeIndex:
+    """Target spans of the english examples of a dataset."""
+
+    def __init__(self, dataset: Dataset) -> None:
+        """Create an empty index of a dataset.
+
+        Spans of a sample are found when they are needed for the first time
+        or in advance by `build`.
+
+        Parameters
+        ----------
+        dataset : Dataset
+            The dataset to index.
+        """
+        self.dataset = dataset
+        # For every word a tuple with the spans array of every example
+        self._spans: Dict[str, Tuple[array, ...]] = {}
+        dataset.add_change_listener(self.invalidate)
+
+    def build(self):
+        """Find the spans of all the examples of the dataset."""
+        for sample in self.dataset:
+            self._index_sample(sample)
+
+    def invalidate(self, word: str):
+        """Forget the spans of a sample after it was changed."""
+        self._spans.pop(word, None)
+
+    def _index_sample(self, sample: Dict) -> Tuple[array, ...]:
+        spans = tuple(find_target_spans(sample['word'], example['example_eng'])
+                      for example in sample['examples'])
+        self._spans[sample['word']] = spans
+        return spans
+
+    def spans(self, word: str, example_idx: int) -> array:
+        """Get the target spans of an example.
+
+        Parameters
+        ----------
+        word : str
+            The word of the sample.
+        example_idx : int
+            An index of the example in the sample's examples.
+
+        Returns
+        -------
+        array
+            Start and end offsets of every occurrence one after another.
+        """
+        spans = self._spans.get(word)
+        if spans is None:
+            spans = self._index_sample(self.dataset[word])
+        return spans[example_idx]
+
+    def render(self, word: str, example_idx: int, blank: str = BLANK) -> str:
+        """Get an english example with the sample's word blanked out.
+
+        Parameters
+        ----------
+        word : str
+            The word of the sample.
+        example_idx : int
+            An index of the example in the sample's examples.
+        blank : str, optional
+            A replacement of the word. By default is `'_____'`.
+
+        Returns
+        -------
+        str
+            The cloze text. It is the example itself if the word
+            is not found in it.
+        """
+        text = self.dataset[word]['examples'][example_idx]['example_eng']
+        spans = self.spans(word, example_idx)
+        parts = []
+        previous_end = 0
+        for i in range(0, len(spans), 2):
+            parts += [text[previous_end:spans[i]], blank]
+            previous_end = spans[i + 1]
+        parts.append(text[previous_end:])
+        return ''.join(parts)
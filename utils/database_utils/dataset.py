@@ -16,7 +16,9 @@ The `Dataset` looks like below:
                 'example_rus': str
             },
             ...
-        ]
+        ],
+        'tags': [str, ...],
+        'deck': str
     },
     {
         'word': 'str',
@@ -37,21 +39,42 @@ The `Dataset` looks like below:
     ...
 ]
 
+`tags` and `deck` are optional. Subsets of a dataset can be selected with
+deck queries over them (see `deck_index`) and are represented as bitmaps
+of sample indexes.
+
 A `Dataset` object can take `str` or `int` as an index and then returns a dict
-associated with the given word or index as described above.
+associated with the given word or index as described above. A slice index,
+`prefix` and `filter` return lazy views of samples (see `dataset_view`).
+
+Samples may be ranked by corpus frequency of their words (see `frequency`).
+If the ranks file lies next to the dataset, samples can be walked most
+frequent first and drawn at random with frequency weights.
 """
 
+from bisect import bisect_left
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-import json
-from typing import Dict, Union, List
+from typing import Callable, Dict, Iterator, Optional, Union, List
 import random
 
+from utils.database_utils.dataset_view import (
+    DatasetView, prefix_successor, sample_predicate)
+from utils.database_utils.deck_index import (
+    DeckIndex, next_set_bit, nth_set_bit, previous_set_bit)
+from utils.database_utils.file_io import (
+    iter_samples, paused_gc, write_samples)
+from utils.database_utils.frequency_ranks import (
+    FrequencyRanks, frequency_path, words_checksum)
+
 
 example_dict = Dict[str, str]
 examples_list = List[example_dict]
 translates_list = List[str]
 sample_type = Dict[str, Union[str, translates_list, examples_list]]
 samples_list = List[sample_type]
+sample_word = itemgetter('word')
 
 
 class Dataset:
@@ -61,45 +84,67 @@ class Dataset:
         if not dataset_path.exists():
             raise FileExistsError(
                 f'The dataset file {dataset_path} does not exists.')
-        with open(dataset_path, 'r') as f:
-            data = f.read()
-        self._samples: samples_list = json.loads(data)
+        self.dataset_path = dataset_path
+        # Samples are indexed while they are read. Saved datasets are
+        # usually sorted already, and only otherwise the index is rebuilt.
+        self._samples: samples_list = []
+        self._word_to_idx = {}
+        in_order = True
+        previous_word = ''
+        with paused_gc():
+            for sample in iter_samples(dataset_path):
+                word = sample['word']
+                in_order = in_order and previous_word <= word
+                previous_word = word
+                self._word_to_idx[word] = len(self._samples)
+                self._samples.append(sample)
 
-        self._samples = list(sorted(self._samples,
-                                    key=lambda sample: sample['word']))
-
-        self._word_to_idx = {sample['word']: i
-                             for i, sample in enumerate(self._samples)}
+        if not in_order:
+            self._samples.sort(key=sample_word)
+            self._word_to_idx = {sample['word']: i
+                                 for i, sample in enumerate(self._samples)}
+        # Whether numeric indexes follow the word order. `add_sample`
+        # appends, so it breaks the order unless the word is the greatest.
+        self._sorted = True
+        # Built on the first deck query
+        self._deck_index: DeckIndex = None
+        # Functions that are called with a word when its sample is changed
+        self._change_listeners: List[Callable[[str], None]] = []
+        # Read from the ranks file on the first use
+        self._frequency_ranks: FrequencyRanks = None
+        self._frequency_ranks_read = False
 
     def __len__(self) -> int:
         return len(self._samples)
     
-    def __iter__(self) -> 'Dataset':
-        self.iterator = iter(self._samples)
-        self.iter_index = 0
-        return self
-    
-    def __next__(self) -> sample_type:
-        if self.iter_index <= len(self._samples):
-            sample = next(self.iterator)
-            self.iter_index += 1
-            return sample
-        else:
-            raise StopIteration
+    def __iter__(self) -> Iterator[sample_type]:
+        return iter(self._samples)
+
+    def _iter_range(self, indexes: range) -> Iterator[sample_type]:
+        """Iterate over the samples of a range of numeric indexes."""
+        if indexes.step == 1:
+            return islice(self._samples, indexes.start, indexes.stop)
+        return map(self._samples.__getitem__, indexes)
             
-    def __getitem__(self, index: Union[int, str]) -> sample_type:
+    def __getitem__(
+        self,
+        index: Union[int, str, slice]
+    ) -> Union[sample_type, DatasetView]:
         """Return a sample from this dataset by a word or a numeric index.
 
         Parameters
         ----------
-        index : Union[int, str]
-            Index for the sample getting.
+        index : Union[int, str, slice]
+            Index for the sample getting. A slice gives a lazy view
+            of the samples.
 
         Returns
         -------
-        sample_type
-            The required sample.
+        Union[sample_type, DatasetView]
+            The required sample or the view.
         """
+        if isinstance(index, slice):
+            return DatasetView(self, range(len(self))[index])
         if isinstance(index, str):
             index = self._word_to_idx[index]
         return self._samples[index]
@@ -134,31 +179,266 @@ class Dataset:
         """
         return self._word_to_idx[word]
     
-    def random_choice(self, exclude: List[str] = None) -> sample_type:
+    @property
+    def is_sorted(self) -> bool:
+        """Whether the numeric indexes of this dataset follow the word order.
+
+        A loaded dataset is sorted. Adding a sample that is not the greatest
+        word makes it unsorted until it is saved and loaded again.
+        """
+        return self._sorted
+
+    def _bisect_word(self, word: str) -> int:
+        """Get an index of the first sample whose word is not less than
+        a given one. The dataset must be sorted."""
+        return bisect_left(self._samples, word, key=sample_word)
+
+    def prefix(self, prefix: str) -> DatasetView:
+        """Get a lazy view of the samples whose words start with a prefix.
+
+        The range of such samples is found by binary search, or if this
+        dataset is not sorted, they are filtered out while iterating.
+
+        Parameters
+        ----------
+        prefix : str
+            The prefix of the words, e.g. `'ac'`.
+
+        Returns
+        -------
+        DatasetView
+            The view.
+        """
+        if not self.is_sorted:
+            return self.filter(
+                lambda sample: sample['word'].startswith(prefix))
+        start = self._bisect_word(prefix)
+        successor = prefix_successor(prefix)
+        stop = self._bisect_word(successor) if successor else len(self)
+        return DatasetView(self, range(start, stop))
+
+    def filter(self, predicate: sample_predicate) -> DatasetView:
+        """Get a lazy view of the samples that satisfy a predicate.
+
+        Parameters
+        ----------
+        predicate : sample_predicate
+            A function that takes a sample and tells whether it is
+            in the view.
+
+        Returns
+        -------
+        DatasetView
+            The view.
+        """
+        return DatasetView(self, range(len(self)), predicate)
+
+    @property
+    def frequency_ranks(self) -> Optional[FrequencyRanks]:
+        """Frequency ranks of the samples of this dataset.
+
+        They are read from the ranks file next to the dataset
+        (see `frequency.rank_dataset`) and are `None` if there is no such
+        file or it was made before the dataset was changed.
+        """
+        if not self._frequency_ranks_read:
+            self._frequency_ranks = FrequencyRanks.load(
+                frequency_path(self.dataset_path), self._checksum())
+            self._frequency_ranks_read = True
+        return self._frequency_ranks
+
+    def _checksum(self) -> int:
+        """Get a checksum of this dataset to match its frequency ranks."""
+        # The keys of the word index are in order of the samples and are
+        # walked several times faster than the sample dicts
+        return words_checksum(self._word_to_idx)
+
+    def _required_frequency_ranks(self) -> FrequencyRanks:
+        ranks = self.frequency_ranks
+        if ranks is None:
+            raise ValueError(f'The dataset {self.dataset_path} is not ranked '
+                             'by frequency.')
+        return ranks
+
+    def by_frequency(self) -> Iterator[sample_type]:
+        """Iterate over the samples of this dataset, the most frequent first.
+
+        Raises
+        ------
+        ValueError
+            If this dataset has no frequency ranks.
+        """
+        return map(self.__getitem__, self._required_frequency_ranks().order)
+
+    def random_choice(
+        self,
+        exclude: List[str] = None,
+        deck: int = None,
+        weighted: bool = False
+    ) -> sample_type:
         """Get a random sample from this dataset.
 
         Parameters
         ----------
         exclude : List[str], optional
             A list of words to avoid when getting a random sample.
+        deck : int, optional
+            A bitmap of sample indexes to choose from (see `select`).
+            By default all samples are used.
+        weighted : bool, optional
+            Whether to draw frequent words more often (see
+            `frequency_ranks`). Draws from a deck are weighted among
+            its members. By default is `False`.
 
         Returns
         -------
         sample_type
             The random sample.
+
+        Raises
+        ------
+        IndexError
+            If there are no samples to choose from.
+        ValueError
+            If `weighted` is set but this dataset has no frequency ranks.
         """
-        indexes = list(range(len(self)))
-        if exclude:
-            for ex_word in exclude:
-                indexes.pop(self._word_to_idx[ex_word])
-        return self[random.choice(indexes)]
+        excluded = ({self.get_word_index(ex_word) for ex_word in exclude}
+                    if exclude else set())
+        if deck is None:
+            candidates = len(self)
+        else:
+            excluded = {index for index in excluded if deck >> index & 1}
+            candidates = deck.bit_count()
+        if len(excluded) >= candidates:
+            raise IndexError('There are no samples to choose from.')
+        if weighted:
+            ranks = self._required_frequency_ranks()
+            return self[ranks.weighted_choice(deck, excluded)]
+        # Rejection sampling avoids building a list of all indexes
+        while True:
+            index = random.randrange(candidates)
+            if deck is not None:
+                index = nth_set_bit(deck, index)
+            if index not in excluded:
+                return self[index]
+
+    def next_index(
+        self,
+        index: int,
+        deck: int = None,
+        by_frequency: bool = False
+    ) -> int:
+        """Get an index of the sample that follows a given one.
+
+        Parameters
+        ----------
+        index : int
+            The index of the current sample.
+        deck : int, optional
+            A non-empty bitmap of sample indexes to walk over
+            (see `select`). By default all samples are used.
+        by_frequency : bool, optional
+            Whether to walk the most frequent first (see `frequency_ranks`)
+            instead of alphabetically. By default is `False`.
+
+        Returns
+        -------
+        int
+            The next index. After the last sample goes the first one.
+
+        Raises
+        ------
+        ValueError
+            If `by_frequency` is set but this dataset has no frequency ranks.
+        """
+        if by_frequency:
+            return self._required_frequency_ranks().next_index(index, deck)
+        if deck is None:
+            return (index + 1) % len(self)
+        return next_set_bit(deck, index)
+
+    def previous_index(
+        self,
+        index: int,
+        deck: int = None,
+        by_frequency: bool = False
+    ) -> int:
+        """Get an index of the sample that precedes a given one.
+
+        Parameters
+        ----------
+        index : int
+            The index of the current sample.
+        deck : int, optional
+            A non-empty bitmap of sample indexes to walk over
+            (see `select`). By default all samples are used.
+        by_frequency : bool, optional
+            Whether to walk the most frequent first (see `frequency_ranks`)
+            instead of alphabetically. By default is `False`.
+
+        Returns
+        -------
+        int
+            The previous index. Before the first sample goes the last one.
+
+        Raises
+        ------
+        ValueError
+            If `by_frequency` is set but this dataset has no frequency ranks.
+        """
+        if by_frequency:
+            return self._required_frequency_ranks().previous_index(index, deck)
+        if deck is None:
+            return (index - 1) % len(self)
+        return previous_set_bit(deck, index)
+
+    @property
+    def deck_index(self) -> DeckIndex:
+        """Bitmaps of the tags and decks of this dataset."""
+        if self._deck_index is None:
+            self._deck_index = DeckIndex(self)
+        return self._deck_index
+
+    def select(self, query: str) -> int:
+        """Get a bitmap of samples that match a deck query.
+
+        Parameters
+        ----------
+        query : str
+            The deck query, e.g. `'ml & !deck:archive'` (see `deck_index`).
+
+        Returns
+        -------
+        int
+            The bitmap whose i-th bit is set if the i-th sample matches.
+        """
+        return self.deck_index.select(query)
+
+    def add_tags(self, word: str, tags: List[str]):
+        """Add tags to a sample of this dataset.
+
+        Parameters
+        ----------
+        word : str
+            The word of the sample.
+        tags : List[str]
+            The tags to add.
+        """
+        sample = self[word]
+        sample_tags = sample.setdefault('tags', [])
+        sample_tags.extend(tag for tag in tags if tag not in sample_tags)
+        if self._deck_index is not None:
+            self._deck_index.add(self.get_word_index(word), sample)
+        self._notify_change(word)
     
     def add_sample(
         self,
         word: str,
         translates: List[str],
         example_eng: str,
-        example_rus: str
+        example_rus: str,
+        tags: List[str] = None,
+        deck: str = None
     ) -> None:
         """Add a given sample to this dataset.
 
@@ -172,20 +452,67 @@ class Dataset:
             An english example string of the sample.
         example_rus : str
             A russian example string of the sample.
+        tags : List[str], optional
+            Tags of the sample.
+        deck : str, optional
+            A deck of the sample.
         """
-        self._samples.append(
-            {'word': word,
-             'translates': translates,
-             'examples': [{
-                 'example_eng': example_eng,
-                 'example_rus': example_rus
-             }]}
-        )
+        sample = make_sample(word, translates, example_eng, example_rus,
+                             tags, deck)
+        # The ranks file is matched against the dataset before the word
+        # is added, otherwise the first read would reject it
+        frequency_ranks = self.frequency_ranks
+        if self._samples and word < self._samples[-1]['word']:
+            self._sorted = False
+        self._samples.append(sample)
         self._word_to_idx[word] = len(self._samples) - 1
+        if frequency_ranks is not None:
+            frequency_ranks.append()
+        if self._deck_index is not None:
+            self._deck_index.add(len(self._samples) - 1, sample)
+        self._notify_change(word)
+
+    def remove_example(self, word: str, example_idx: int):
+        """Remove an example from a sample of this dataset.
+
+        Parameters
+        ----------
+        word : str
+            The word of the sample.
+        example_idx : int
+            An index of the example in the sample's examples.
+
+        Raises
+        ------
+        ValueError
+            If it is the last example of the sample.
+        """
+        examples = self[word]['examples']
+        if len(examples) == 1:
+            raise ValueError(f'Can not remove the last example of "{word}".')
+        examples.pop(example_idx)
+        self._notify_change(word)
+
+    def add_change_listener(self, listener: Callable[[str], None]):
+        """Register a function to call when a sample is added or changed.
+
+        Parameters
+        ----------
+        listener : Callable[[str], None]
+            The function. It takes the word of the changed sample.
+        """
+        self._change_listeners.append(listener)
+
+    def _notify_change(self, word: str):
+        for listener in self._change_listeners:
+            listener(word)
         
     def save_dataset(self, save_path: Union[Path, str]):
         """Save this dataset to a json file.
 
+        The file is compressed if its extension is one of `file_io`'s
+        compressed extensions, e.g. `words.json.gz`.
+
         Parameters
         ----------
         save_path : Union[Path, str]
@@ -194,6 +521,29 @@ class Dataset:
         if isinstance(save_path, str):
             save_path = Path(save_path)
         save_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(save_path, 'w') as f:
-            json.dump(self._samples, f, sort_keys=False,
-                      indent=4, ensure_ascii=False)
+        write_samples(self._samples, save_path)
+
+
+def make_sample(
+    word: str,
+    translates: List[str],
+    example_eng: str,
+    example_rus: str,
+    tags: List[str] = None,
+    deck: str = None
+) -> sample_type:
+    """Make a sample dict with one example.
+
+    `tags` and `deck` are put into the sample only if they are given.
+    """
+    sample = {'word': word,
+              'translates': translates,
+              'examples': [{
+                  'example_eng': example_eng,
+                  'example_rus': example_rus
+              }]}
+    if tags:
+        sample['tags'] = list(tags)
+    if deck is not None:
+        sample['deck'] = deck
+    return sample
@@ -0,0 +1,143 @@
+"""A module with lazy views over a `Dataset`.
+
+A view is a range of numeric indexes of a dataset, optionally narrowed
+by a predicate over samples. It does not copy the samples: they are taken
+from the dataset while the view is iterated, and every iteration is
+independent, so views may be iterated in nested loops.
+
+Views are made by `Dataset` methods:
+    dataset[10:20]              a slice
+    dataset.prefix('ac')        samples whose words start with 'ac'
+    dataset.filter(predicate)   samples for which the predicate is true
+
+The index range of a view is fixed when it is made, so a view made before
+adding a sample to a sharded dataset, which shifts indexes, is outdated.
+"""
+
+from typing import Callable, Dict, Iterator, Union
+
+
+sample_predicate = Callable[[Dict], bool]
+
+
+class DatasetView:
+    """A lazy, reentrant view of a range of samples of a dataset."""
+
+    def __init__(
+        self,
+        dataset,
+        indexes: range,
+        predicate: sample_predicate = None
+    ) -> None:
+        """Create a view.
+
+        Parameters
+        ----------
+        dataset : Dataset
+            The dataset to view.
+        indexes : range
+            Numeric indexes of the viewed samples in the dataset.
+        predicate : sample_predicate, optional
+            A function that tells whether a sample is in the view.
+            By default all samples of the range are in it.
+        """
+        self.dataset = dataset
+        self.indexes = indexes
+        self.predicate = predicate
+
+    def __iter__(self) -> Iterator[Dict]:
+        samples = self.dataset._iter_range(self.indexes)
+        if self.predicate is None:
+            return samples
+        return filter(self.predicate, samples)
+
+    def __len__(self) -> int:
+        """Get a number of samples in this view.
+
+        A view with a predicate is iterated to count them.
+        """
+        if self.predicate is None:
+            return len(self.indexes)
+        return sum(1 for _ in self)
+
+    def __bool__(self) -> bool:
+        return next(iter(self), None) is not None
+
+    def __getitem__(
+        self,
+        index: Union[int, slice]
+    ) -> Union[Dict, 'DatasetView']:
+        """Get a sample of this view by its position or a narrower view.
+
+        Parameters
+        ----------
+        index : Union[int, slice]
+            A position of the sample or a slice of positions.
+
+        Returns
+        -------
+        Union[Dict, DatasetView]
+            The sample or the view of the slice.
+
+        Raises
+        ------
+        TypeError
+            If this view has a predicate. Positions of its samples are
+            unknown until it is iterated.
+        """
+        if self.predicate is not None:
+            raise TypeError('A filtered view can not be indexed, '
+                            'iterate over it instead.')
+        if isinstance(index, slice):
+            return DatasetView(self.dataset, self.indexes[index])
+        return self.dataset[self.indexes[index]]
+
+    def __contains__(self, word: str) -> bool:
+        """Check whether a sample of a given word is in this view."""
+        if word not in self.dataset:
+            return False
+        if self.dataset.get_word_index(word) not in self.indexes:
+            return False
+        return self.predicate is None or self.predicate(self.dataset[word])
+
+    def filter(self, predicate: sample_predicate) -> 'DatasetView':
+        """Get a view of the samples of this view that satisfy a predicate.
+
+        Parameters
+        ----------
+        predicate : sample_predicate
+            A function that tells whether a sample is in the new view.
+
+        Returns
+        -------
+        DatasetView
+            The new view.
+        """
+        if self.predicate is not None:
+            predicate = _both(self.predicate, predicate)
+        return DatasetView(self.dataset, self.indexes, predicate)
+
+    def words(self) -> Iterator[str]:
+        """Iterate over the words of the samples of this view."""
+        return (sample['word'] for sample in self)
+
+
+def _both(
+    first: sample_predicate,
+    second: sample_predicate
+) -> sample_predicate:
+    return lambda sample: first(sample) and second(sample)
+
+
+def prefix_successor(prefix: str) -> str:
+    """Get the least string that is greater than all strings with a prefix.
+
+    Returns
+    -------
+    str
+        The string or `''` if there is no such string.
+    """
+    prefix = prefix.rstrip(chr(0x10FFFF))
+    if prefix == '':
+        return ''
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
@@ -0,0 +1,353 @@
+"""A module for filtering a `Dataset` by tags and decks.
+
+Every sample may have a list of tags and a deck name:
+{
+    'word': str,
+    ...
+    'tags': [str, ...],
+    'deck': str
+}
+
+`DeckIndex` keeps a bitmap for every tag and deck. A bitmap is a python
+`int` whose i-th bit is set if the i-th sample of the dataset has the label,
+so AND, OR and NOT of whole decks are single integer operations.
+
+A deck query combines labels:
+    ml & !deck:archive
+    (ml | cv) & week-42
+A plain name means a tag and `deck:name` means a deck. `&`, `|` and `!`
+may also be written as `and`, `or` and `not`.
+"""
+
+import re
+from typing import Callable, Dict, Iterable, List
+
+
+bitmap_query = Callable[['DeckIndex'], int]
+
+QUERY_TOKEN = re.compile(r'\s*(?:(\(|\)|&|\||!)|([^\s()&|!]+))')
+LABEL = re.compile(r'[^\s()&|!,]+')
+KEYWORDS = {'and': '&', 'or': '|', 'not': '!'}
+
+
+class DeckIndex:
+    """Bitmaps of samples for every tag and deck of a dataset."""
+
+    def __init__(self, samples: Iterable[Dict] = ()) -> None:
+        """Create an index of given samples.
+
+        Parameters
+        ----------
+        samples : Iterable[Dict], optional
+            Samples in order of the dataset indexes. By default is empty.
+        """
+        # ORing bits one by one into a growing int copies it every time,
+        # so the indexes of every label are collected first
+        tag_idxs: Dict[str, List[int]] = {}
+        deck_idxs: Dict[str, List[int]] = {}
+        length = 0
+        for sample_idx, sample in enumerate(samples):
+            for tag in sample.get('tags', ()):
+                tag_idxs.setdefault(tag, []).append(sample_idx)
+            deck = sample.get('deck')
+            if deck is not None:
+                deck_idxs.setdefault(deck, []).append(sample_idx)
+            length = sample_idx + 1
+        self._tags: Dict[str, int] = {
+            tag: bitmap_from_indexes(idxs) for tag, idxs in tag_idxs.items()}
+        self._decks: Dict[str, int] = {
+            deck: bitmap_from_indexes(idxs)
+            for deck, idxs in deck_idxs.items()}
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def add(self, sample_idx: int, sample: Dict):
+        """Put a sample's tags and deck into the index.
+
+        Used for samples added after the index was built.
+
+        Parameters
+        ----------
+        sample_idx : int
+            An index of the sample in the dataset.
+        sample : Dict
+            The sample.
+        """
+        bit = 1 << sample_idx
+        for tag in sample.get('tags', ()):
+            self._tags[tag] = self._tags.get(tag, 0) | bit
+        deck = sample.get('deck')
+        if deck is not None:
+            self._decks[deck] = self._decks.get(deck, 0) | bit
+        self._length = max(self._length, sample_idx + 1)
+
+    def tag(self, name: str) -> int:
+        """Get a bitmap of samples that have a given tag."""
+        return self._tags.get(name, 0)
+
+    def deck(self, name: str) -> int:
+        """Get a bitmap of samples that are in a given deck."""
+        return self._decks.get(name, 0)
+
+    def all(self) -> int:
+        """Get a bitmap of all samples."""
+        return (1 << self._length) - 1
+
+    @property
+    def tags(self) -> List[str]:
+        return sorted(self._tags)
+
+    @property
+    def decks(self) -> List[str]:
+        return sorted(self._decks)
+
+    def select(self, query: str) -> int:
+        """Get a bitmap of samples that match a deck query.
+
+        Parameters
+        ----------
+        query : str
+            The deck query, e.g. `'ml & !deck:archive'`.
+
+        Returns
+        -------
+        int
+            The bitmap of the matching samples.
+        """
+        return parse_deck_query(query)(self)
+
+
+def validate_label(label: str) -> str:
+    """Check that a tag or a deck name can be used in deck queries.
+
+    Parameters
+    ----------
+    label : str
+        The tag or the deck name.
+
+    Returns
+    -------
+    str
+        The same label.
+
+    Raises
+    ------
+    ValueError
+        If the label contains whitespace, a comma or an operator, or is
+        a keyword.
+    """
+    if (LABEL.fullmatch(label) is None or label.lower() in KEYWORDS or
+            label.startswith('deck:')):
+        raise ValueError(f'"{label}" can not be a tag or a deck name.')
+    return label
+
+
+def parse_tags(text: str) -> List[str]:
+    """Split a user's input into tags.
+
+    Parameters
+    ----------
+    text : str
+        Tags separated by whitespace or commas, e.g. `'ml, week-42'`.
+
+    Returns
+    -------
+    List[str]
+        The tags without repeats.
+
+    Raises
+    ------
+    ValueError
+        If a tag can not be used in deck queries (see `validate_label`).
+    """
+    tags = []
+    for tag in re.split(r'[\s,]+', text.strip()):
+        if tag and validate_label(tag) not in tags:
+            tags.append(tag)
+    return tags
+
+
+def bitmap_from_indexes(indexes: List[int]) -> int:
+    """Make a bitmap with given bits set.
+
+    The bits are packed into a `bytearray` that is converted to an int
+    once, so the work is linear in the highest index.
+    """
+    if not indexes:
+        return 0
+    packed = bytearray(max(indexes) // 8 + 1)
+    for index in indexes:
+        packed[index >> 3] |= 1 << (index & 7)
+    return int.from_bytes(packed, 'little')
+
+
+def parse_deck_query(query: str) -> bitmap_query:
+    """Parse a deck query into a function that evaluates it on an index.
+
+    Parameters
+    ----------
+    query : str
+        The deck query, e.g. `'(ml | cv) & !deck:archive'`.
+
+    Returns
+    -------
+    bitmap_query
+        A function that takes `DeckIndex` and returns the query's bitmap.
+
+    Raises
+    ------
+    ValueError
+        If the query is malformed.
+    """
+    tokens = []
+    pos = 0
+    query = query.strip()
+    while pos < len(query):
+        match = QUERY_TOKEN.match(query, pos)
+        operator, name = match.groups()
+        if operator is None and name.lower() in KEYWORDS:
+            operator, name = KEYWORDS[name.lower()], None
+        tokens.append(operator or name)
+        pos = match.end()
+    if not tokens:
+        raise ValueError('The deck query is empty.')
+    tokens.append('')  # the end of the query
+    position = 0
+
+    def peek():
+        return tokens[position]
+
+    def take(expected=None):
+        nonlocal position
+        token = tokens[position]
+        if expected is not None and token != expected:
+            raise ValueError(f'Expected "{expected or "the end"}" in the '
+                             f'deck query "{query}", '
+                             f'got "{token or "the end"}".')
+        position += 1
+        return token
+
+    # expression := term ('|' term)*
+    # term := factor ('&' factor)*
+    # factor := '!' factor | '(' expression ')' | label
+    def expression():
+        result = term()
+        while peek() == '|':
+            take()
+            result = union(result, term())
+        return result
+
+    def term():
+        result = factor()
+        while peek() == '&':
+            take()
+            result = intersection(result, factor())
+        return result
+
+    def factor():
+        token = peek()
+        if token == '!':
+            take()
+            return complement(factor())
+        if token == '(':
+            take()
+            result = expression()
+            take(')')
+            return result
+        if token in ('', '&', '|', ')'):
+            raise ValueError(f'Expected a tag in the deck query "{query}", '
+                             f'got "{token or "the end"}".')
+        take()
+        if token.startswith('deck:'):
+            return lambda index, name=token[5:]: index.deck(name)
+        return lambda index: index.tag(token)
+
+    result = expression()
+    take('')
+    return result
+
+
+def union(left: bitmap_query, right: bitmap_query) -> bitmap_query:
+    return lambda index: left(index) | right(index)
+
+
+def intersection(left: bitmap_query, right: bitmap_query) -> bitmap_query:
+    return lambda index: left(index) & right(index)
+
+
+def complement(operand: bitmap_query) -> bitmap_query:
+    return lambda index: index.all() & ~operand(index)
+
+
+def next_set_bit(bitmap: int, index: int) -> int:
+    """Get the first set bit after a given one, wrapping around to the start.
+
+    Parameters
+    ----------
+    bitmap : int
+        A non-empty bitmap.
+    index : int
+        The bit to start after.
+
+    Returns
+    -------
+    int
+        The index of the found bit.
+    """
+    rest = bitmap >> (index + 1)
+    if rest:
+        return index + 1 + (rest & -rest).bit_length() - 1
+    return (bitmap & -bitmap).bit_length() - 1
+
+
+def previous_set_bit(bitmap: int, index: int) -> int:
+    """Get the last set bit before a given one, wrapping around to the end.
+
+    Parameters
+    ----------
+    bitmap : int
+        A non-empty bitmap.
+    index : int
+        The bit to start before.
+
+    Returns
+    -------
+    int
+        The index of the found bit.
+    """
+    lower = bitmap & ((1 << max(index, 0)) - 1)
+    if lower:
+        return lower.bit_length() - 1
+    return bitmap.bit_length() - 1
+
+
+def nth_set_bit(bitmap: int, n: int) -> int:
+    """Get an index of the n-th (from zero) set bit of a bitmap.
+
+    Binary search over the bit counts of the bitmap's prefixes, every step
+    of which is one shift and one popcount of the whole integer.
+
+    Parameters
+    ----------
+    bitmap : int
+        The bitmap.
+    n : int
+        The number of the set bit. Must be less than `bitmap.bit_count()`.
+
+    Returns
+    -------
+    int
+        The index of the bit.
+    """
+    total = bitmap.bit_count()
+    low, high = 0, bitmap.bit_length() - 1
+    while low < high:
+        middle = (low + high) // 2
+        # The number of set bits among the bits 0..middle
+        if total - (bitmap >> (middle + 1)).bit_count() > n:
+            high = middle
+        else:
+            low = middle + 1
+    return low
@@ -0,0 +1,332 @@
+"""A module for finding near-duplicate examples in a `Dataset`.
+
+Examples are compared by Jaccard similarity of their word shingles (runs of
+consecutive words). Before shingling, a text is case folded and cleared of
+punctuation and english articles, so examples that differ only in them
+are equal.
+
+Comparing all pairs of examples is quadratic, so candidates are found with
+MinHash and locality-sensitive hashing: every example gets a short
+signature of minimal hash values, the signature is cut into bands, and
+only examples that share a whole band are compared exactly. The work is
+linear in the number of examples.
+"""
+
+import random
+import re
+from typing import Dict, Iterator, List, NamedTuple, Set, Tuple
+import zlib
+
+from utils.database_utils.dataset import Dataset
+
+
+WORD = re.compile(r'\w+')
+ARTICLES = {'a', 'an', 'the'}
+# A Mersenne prime for the universal hash of shingles
+MINHASH_PRIME = (1 << 61) - 1
+# Distinguishes values borrowed by empty bins from own values of bins
+ROTATION_OFFSET = MINHASH_PRIME + 1
+
+
+class ExampleRef(NamedTuple):
+    """A reference to an example of a dataset."""
+    word: str
+    example_idx: int
+
+
+def example_shingles(example: Dict[str, str], size: int = 2) -> Set[str]:
+    """Get word shingles of both sentences of an example.
+
+    Parameters
+    ----------
+    example : Dict[str, str]
+        The example.
+    size : int, optional
+        A number of words in a shingle. By default is equal 2.
+
+    Returns
+    -------
+    Set[str]
+        The shingles. English and russian ones are prefixed differently.
+    """
+    shingles = set()
+    for key, prefix in (('example_eng', 'e'), ('example_rus', 'r')):
+        words = [word for word in WORD.findall(example[key].casefold())
+                 if word not in ARTICLES]
+        if len(words) < size:
+            shingles.add(prefix + ' '.join(words))
+            continue
+        for i in range(len(words) - size + 1):
+            shingles.add(prefix + ' '.join(words[i:i + size]))
+    return shingles
+
+
+def jaccard(first: Set[str], second: Set[str]) -> float:
+    """Get Jaccard similarity of two sets."""
+    if not first and not second:
+        return 1.0
+    return len(first & second) / len(first | second)
+
+
+class MinHasher:
+    """Computes MinHash signatures of shingle sets.
+
+    One permutation hashing is used: every shingle is hashed once and goes
+    to one of `num_perm` bins by its hash, and the signature is the minimal
+    hash of every bin. Empty bins take the value of the nearest non-empty
+    bin to the right (rotation densification). This costs one hash per
+    shingle instead of `num_perm`.
+    """
+
+    def __init__(self, num_perm: int = 32, seed: int = 0) -> None:
+        """Create a hasher.
+
+        Parameters
+        ----------
+        num_perm : int, optional
+            A length of signatures. By default is equal 32.
+        seed : int, optional
+            A seed of the hash function. By default is equal 0.
+        """
+        rng = random.Random(seed)
+        self._num_perm = num_perm
+        self._multiplier = rng.randrange(1, MINHASH_PRIME)
+        self._increment = rng.randrange(MINHASH_PRIME)
+
+    def signature(self, shingles: Set[str]) -> Tuple[int, ...]:
+        """Get a MinHash signature of a shingle set.
+
+        Parameters
+        ----------
+        shingles : Set[str]
+            The shingles.
+
+        Returns
+        -------
+        Tuple[int, ...]
+            The minimal hash of every bin.
+        """
+        num_perm = self._num_perm
+        empty = MINHASH_PRIME
+        bins = [empty] * num_perm
+        for shingle in shingles:
+            value = ((zlib.crc32(shingle.encode()) * self._multiplier +
+                      self._increment) % MINHASH_PRIME)
+            bin_idx = value % num_perm
+            if value < bins[bin_idx]:
+                bins[bin_idx] = value
+        if empty in bins and len(shingles) > 0:
+            # Walk leftwards around the bins starting from a non-empty one,
+            # carrying the nearest non-empty bin on the right
+            densified = list(bins)
+            start = next(i for i, value in enumerate(bins) if value != empty)
+            nearest, distance = bins[start], 0
+            for step in range(1, num_perm + 1):
+                bin_idx = (start - step) % num_perm
+                distance += 1
+                if bins[bin_idx] == empty:
+                    densified[bin_idx] = nearest + distance * ROTATION_OFFSET
+                else:
+                    nearest, distance = bins[bin_idx], 0
+            bins = densified
+        return tuple(bins)
+
+
+class _DisjointSets:
+    """Union-find over integer ids."""
+
+    def __init__(self, size: int) -> None:
+        self._parents = list(range(size))
+
+    def find(self, item: int) -> int:
+        root = item
+        while self._parents[root] != root:
+            root = self._parents[root]
+        while self._parents[item] != root:
+            self._parents[item], item = root, self._parents[item]
+        return root
+
+    def union(self, first: int, second: int):
+        first, second = self.find(first), self.find(second)
+        if first != second:
+            self._parents[max(first, second)] = min(first, second)
+
+
+def find_duplicate_clusters(
+    dataset: Dataset,
+    threshold: float = 0.8,
+    num_perm: int = 32,
+    bands: int = 8,
+    shingle_size: int = 2
+) -> List[List[ExampleRef]]:
+    """Find clusters of near-duplicate examples over a whole dataset.
+
+    A cluster may contain examples of one sample or of different samples.
+
+    Parameters
+    ----------
+    dataset : Dataset
+        The dataset to search in.
+    threshold : float, optional
+        A minimal Jaccard similarity of shingles of duplicate examples.
+        By default is equal 0.8.
+    num_perm : int, optional
+        A length of MinHash signatures. By default is equal 32.
+    bands : int, optional
+        A number of LSH bands, `num_perm` must be divisible by it. More
+        bands find more candidates with lower similarity but take longer.
+        By default is equal 8.
+    shingle_size : int, optional
+        A number of words in a shingle. By default is equal 2.
+
+    Returns
+    -------
+    List[List[ExampleRef]]
+        Clusters of two or more examples in order of the dataset.
+    """
+    if num_perm % bands != 0:
+        raise ValueError('num_perm must be divisible by bands.')
+    rows = num_perm // bands
+    hasher = MinHasher(num_perm)
+
+    refs: List[ExampleRef] = []
+    shingle_sets: List[Set[str]] = []
+    buckets: Dict[Tuple, List[int]] = {}
+    # Exact copies are joined directly and are not hashed again
+    exact_copies: Dict[Tuple[str, str], int] = {}
+    copy_pairs: List[Tuple[int, int]] = []
+    for sample in dataset:
+        for example_idx, example in enumerate(sample['examples']):
+            ref_id = len(refs)
+            refs.append(ExampleRef(sample['word'], example_idx))
+            text = (example['example_eng'], example['example_rus'])
+            original_id = exact_copies.setdefault(text, ref_id)
+            if original_id != ref_id:
+                copy_pairs.append((original_id, ref_id))
+                shingle_sets.append(shingle_sets[original_id])
+                continue
+
+            shingles = example_shingles(example, shingle_size)
+            shingle_sets.append(shingles)
+            signature = hasher.signature(shingles)
+            for band in range(bands):
+                key = (band,) + signature[band * rows:(band + 1) * rows]
+                buckets.setdefault(key, []).append(ref_id)
+
+    clusters = _DisjointSets(len(refs))
+    for original_id, ref_id in copy_pairs:
+        clusters.union(original_id, ref_id)
+    for ids in buckets.values():
+        # Comparing every member with the first one and its neighbour keeps
+        # big buckets of copies linear instead of quadratic
+        for i in range(1, len(ids)):
+            for other in {ids[0], ids[i - 1]}:
+                if (clusters.find(ids[i]) != clusters.find(other) and
+                        jaccard(shingle_sets[ids[i]],
+                                shingle_sets[other]) >= threshold):
+                    clusters.union(ids[i], other)
+
+    members: Dict[int, List[ExampleRef]] = {}
+    for i, ref in enumerate(refs):
+        members.setdefault(clusters.find(i), []).append(ref)
+    return [cluster for cluster in members.values() if len(cluster) > 1]
+
+
+def iter_redundant_examples(
+    dataset: Dataset,
+    clusters: List[List[ExampleRef]],
+    cross_sample: bool = False,
+    threshold: float = 0.8,
+    shingle_size: int = 2
+) -> Iterator[ExampleRef]:
+    """Get examples that can be removed from duplicate clusters.
+
+    Clusters are joined transitively, so two examples of one cluster may
+    be less similar than the threshold. The first example of every cluster
+    is kept, and every other example is redundant only if it is within
+    the threshold of an example that is kept. Besides, this kept example
+    must belong to the same sample unless `cross_sample` is set. Other
+    examples are kept too and later ones are compared with them as well.
+
+    Parameters
+    ----------
+    dataset : Dataset
+        The dataset the clusters were found in.
+    clusters : List[List[ExampleRef]]
+        Clusters from `find_duplicate_clusters`.
+    cross_sample : bool, optional
+        Whether duplicates in different samples are redundant.
+        By default is `False`.
+    threshold : float, optional
+        A minimal Jaccard similarity of a redundant example and a kept one.
+        By default is equal 0.8.
+    shingle_size : int, optional
+        A number of words in a shingle. By default is equal 2.
+
+    Yields
+    ------
+    ExampleRef
+        The next redundant example.
+    """
+    for cluster in clusters:
+        # Shingles of the kept examples by the word they can absorb
+        # duplicates of, a single group if `cross_sample` is set
+        kept: Dict[str, List[Set[str]]] = {}
+        for ref in cluster:
+            example = dataset[ref.word]['examples'][ref.example_idx]
+            shingles = example_shingles(example, shingle_size)
+            group = kept.setdefault('' if cross_sample else ref.word, [])
+            if any(jaccard(shingles, kept_shingles) >= threshold
+                   for kept_shingles in group):
+                yield ref
+            else:
+                group.append(shingles)
+
+
+def remove_duplicates(
+    dataset: Dataset,
+    clusters: List[List[ExampleRef]],
+    cross_sample: bool = False,
+    threshold: float = 0.8,
+    shingle_size: int = 2
+) -> int:
+    """Remove redundant near-duplicate examples from a dataset.
+
+    Only examples within the threshold of a kept example are removed
+    (see `iter_redundant_examples`). A sample always keeps at least
+    one example.
+
+    Parameters
+    ----------
+    dataset : Dataset
+        The dataset to clean.
+    clusters : List[List[ExampleRef]]
+        Clusters from `find_duplicate_clusters` for this dataset.
+    cross_sample : bool, optional
+        Whether to remove duplicates of examples of other samples too.
+        By default is `False`.
+    threshold : float, optional
+        A minimal Jaccard similarity of a removed example and a kept one,
+        the one the clusters were found with. By default is equal 0.8.
+    shingle_size : int, optional
+        A number of words in a shingle, the one the clusters were found
+        with. By default is equal 2.
+
+    Returns
+    -------
+    int
+        A number of removed examples.
+    """
+    redundant: Dict[str, List[int]] = {}
+    for ref in iter_redundant_examples(dataset, clusters, cross_sample,
+                                       threshold, shingle_size):
+        redundant.setdefault(ref.word, []).append(ref.example_idx)
+
+    removed = 0
+    for word, example_idxs in redundant.items():
+        # Later examples first, so that earlier indexes stay valid
+        for example_idx in sorted(example_idxs, reverse=True):
+            if len(dataset[word]['examples']) > 1:
+                dataset.remove_example(word, example_idx)
+                removed += 1
+    return removed
@@ -0,0 +1,173 @@
+"""A module for exporting a dataset to formats of other tools.
+
+Supported formats:
+    csv     comma separated values with a header row
+    tsv     tab separated values with a header row
+    anki    a tab separated text file with Anki's import headers
+            (Anki 2.1.55+), tags and decks are imported too
+
+Export is a pipeline of generators: samples are read one by one
+(`iter_samples` reads a file without building a `Dataset`), turned into
+rows and written by `csv.writer`, so memory use does not depend on the
+dataset size.
+
+Rows are made per sample, with all examples of the sample joined by line
+breaks, or per example. Tags are joined by spaces as Anki expects, and
+spaces inside tags are replaced by underscores.
+"""
+
+import csv
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Union
+
+
+EXPORT_FORMATS = ('csv', 'tsv', 'anki')
+ROW_MODES = ('sample', 'example')
+COLUMNS = ['word', 'translates', 'example_eng', 'example_rus', 'tags', 'deck']
+ANKI_HEADER = (
+    '#separator:tab\n'
+    '#html:false\n'
+    '#columns:' + '\t'.join(COLUMNS) + '\n'
+    f'#tags column:{COLUMNS.index("tags") + 1}\n'
+    f'#deck column:{COLUMNS.index("deck") + 1}\n'
+)
+# Output is written by large blocks since rows are short
+WRITE_BUFFER_SIZE = 2 ** 20
+
+
+def format_from_path(path: Union[Path, str]) -> str:
+    """Guess an export format by a file extension.
+
+    `.csv` is csv, `.tsv` is tsv and `.txt` is anki.
+
+    Raises
+    ------
+    ValueError
+        If the extension is unknown.
+    """
+    suffix = Path(path).suffix.lower()
+    formats = {'.csv': 'csv', '.tsv': 'tsv', '.txt': 'anki'}
+    if suffix not in formats:
+        raise ValueError(f'Can not guess an export format of {path}, '
+                         f'expected one of {", ".join(formats)}.')
+    return formats[suffix]
+
+
+def iter_rows(
+    samples: Iterable[Dict],
+    rows: str = 'sample',
+    translates_separator: str = ', '
+) -> Iterator[List[str]]:
+    """Turn samples into rows of `COLUMNS` one by one.
+
+    Parameters
+    ----------
+    samples : Iterable[Dict]
+        The samples, e.g. a `Dataset`, a view of it or `iter_samples(path)`.
+    rows : str, optional
+        `'sample'` for a row per sample or `'example'` for a row per
+        example. By default is `'sample'`.
+    translates_separator : str, optional
+        A string to join translates with. By default is `', '`.
+
+    Yields
+    ------
+    List[str]
+        The next row.
+
+    Raises
+    ------
+    ValueError
+        If `rows` is unknown.
+    """
+    if rows not in ROW_MODES:
+        raise ValueError(f'Unknown row mode "{rows}", '
+                         f'expected one of {", ".join(ROW_MODES)}.')
+    for sample in samples:
+        word = sample['word']
+        translates = translates_separator.join(sample['translates'])
+        tags = ' '.join(tag.replace(' ', '_')
+                        for tag in sample.get('tags', ()))
+        deck = sample.get('deck', '')
+        examples = sample['examples']
+        if rows == 'sample':
+            yield [word, translates,
+                   '\n'.join(example['example_eng'] for example in examples),
+                   '\n'.join(example['example_rus'] for example in examples),
+                   tags, deck]
+        else:
+            for example in examples:
+                yield [word, translates, example['example_eng'],
+                       example['example_rus'], tags, deck]
+
+
+def export_samples(
+    samples: Iterable[Dict],
+    path: Union[Path, str],
+    export_format: str = None,
+    rows: str = 'sample',
+    translates_separator: str = ', '
+) -> int:
+    """Write samples to a file of another tool's format.
+
+    Parameters
+    ----------
+    samples : Iterable[Dict]
+        The samples, e.g. a `Dataset`, a view of it or `iter_samples(path)`.
+    path : Union[Path, str]
+        The path of the output file.
+    export_format : str, optional
+        One of `EXPORT_FORMATS`. By default is guessed by the extension
+        of `path` (see `format_from_path`).
+    rows : str, optional
+        `'sample'` for a row per sample or `'example'` for a row per
+        example. By default is `'sample'`.
+    translates_separator : str, optional
+        A string to join translates with. By default is `', '`.
+
+    Returns
+    -------
+    int
+        A number of written rows.
+
+    Raises
+    ------
+    ValueError
+        If the format or the row mode is unknown.
+    """
+    if export_format is None:
+        export_format = format_from_path(path)
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f'Unknown export format "{export_format}", '
+                         f'expected one of {", ".join(EXPORT_FORMATS)}.')
+    row_iter = iter_rows(samples, rows, translates_separator)
+    counted_rows = _counted(row_iter)
+
+    with open(path, 'w', encoding='utf-8', newline='',
+              buffering=WRITE_BUFFER_SIZE) as f:
+        if export_format == 'csv':
+            writer = csv.writer(f)
+        else:
+            writer = csv.writer(f, delimiter='\t', lineterminator='\n')
+        if export_format == 'anki':
+            f.write(ANKI_HEADER)
+        else:
+            writer.writerow(COLUMNS)
+        writer.writerows(counted_rows)
+    return counted_rows.count
+
+
+class _counted:
+    """An iterator wrapper that counts the passed items."""
+
+    def __init__(self, iterator: Iterator) -> None:
+        self.iterator = iterator
+        self.count = 0
+
+    def __iter__(self) -> '_counted':
+        return self
+
+    def __next__(self):
+        item = next(self.iterator)
+        self.count += 1
+        return item
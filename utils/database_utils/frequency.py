@@ -0,0 +1,148 @@
+"""A module for ranking dataset samples by corpus frequency of their words.
+
+Frequencies of tokens are counted over the english examples of a dataset,
+optionally merged with a local frequency list, e.g. one of the
+"word count" lists made from subtitles or wikipedia. A sample's frequency
+is the total count of its word's inflected forms (see `cloze.word_forms`);
+a phrase is as frequent as its rarest word.
+
+`rank_dataset` streams the dataset file twice without building a `Dataset`:
+once to count tokens and once to score the samples. The result is saved
+as `FrequencyRanks` next to the dataset, and `Dataset` serves "most
+frequent first" order and frequency-weighted sampling from it.
+"""
+
+from collections import Counter
+import json
+from pathlib import Path
+import re
+from typing import Dict, Iterable, Union
+
+from utils.database_utils.cloze import TOKEN, word_forms
+from utils.database_utils.frequency_ranks import (
+    FrequencyRanks, frequency_path, manifest_checksum, words_checksum)
+from utils.database_utils.sharded_dataset import (
+    MANIFEST_NAME, iter_dataset_samples)
+
+
+FREQUENCY_LIST_LINE = re.compile(r'\s*(.+?)[\s,;]+(\d+)\s*')
+
+
+def count_tokens(samples: Iterable[Dict], counts: Counter = None) -> Counter:
+    """Count case folded tokens of the english examples of samples.
+
+    Parameters
+    ----------
+    samples : Iterable[Dict]
+        The samples, e.g. `iter_dataset_samples(path)`.
+    counts : Counter, optional
+        Counts to add to. By default the counting starts from zero.
+
+    Returns
+    -------
+    Counter
+        The token counts.
+    """
+    if counts is None:
+        counts = Counter()
+    for sample in samples:
+        for example in sample['examples']:
+            counts.update(TOKEN.findall(example['example_eng'].casefold()))
+    return counts
+
+
+def read_frequency_list(path: Union[Path, str]) -> Counter:
+    """Read a frequency list file.
+
+    Every line is a word and its count separated by whitespace, a comma or
+    a semicolon. Empty lines and lines starting with `#` are skipped.
+
+    Parameters
+    ----------
+    path : Union[Path, str]
+        The path of the file.
+
+    Returns
+    -------
+    Counter
+        The counts of the case folded words.
+
+    Raises
+    ------
+    ValueError
+        If a line is malformed.
+    """
+    counts = Counter()
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_idx, line in enumerate(f, 1):
+            if line.isspace() or line.lstrip().startswith('#'):
+                continue
+            match = FREQUENCY_LIST_LINE.fullmatch(line)
+            if match is None:
+                raise ValueError(
+                    f'{path}:{line_idx}: expected a word and its count.')
+            counts[match[1].casefold()] += int(match[2])
+    return counts
+
+
+def word_frequency(word: str, counts: Counter) -> int:
+    """Get a corpus frequency of a dataset word or phrase.
+
+    Parameters
+    ----------
+    word : str
+        The word or the phrase.
+    counts : Counter
+        Token counts of the corpus.
+
+    Returns
+    -------
+    int
+        The total count of the word's forms, for a phrase the least
+        count of its words.
+    """
+    parts = word.casefold().split()
+    if not parts:
+        return 0
+    last_count = sum(counts[form] for form in word_forms(parts[-1]))
+    return min([counts[part] for part in parts[:-1]] + [last_count])
+
+
+def rank_dataset(
+    dataset_path: Union[Path, str],
+    frequency_list: Union[Path, str] = None
+) -> FrequencyRanks:
+    """Rank the samples of a dataset and save the ranks next to it.
+
+    Parameters
+    ----------
+    dataset_path : Union[Path, str]
+        A path to a dataset file or to a sharded dataset directory.
+    frequency_list : Union[Path, str], optional
+        A frequency list file to merge with the dataset's own counts
+        (see `read_frequency_list`).
+
+    Returns
+    -------
+    FrequencyRanks
+        The saved ranks.
+    """
+    dataset_path = Path(dataset_path)
+    counts = count_tokens(iter_dataset_samples(dataset_path))
+    if frequency_list is not None:
+        counts.update(read_frequency_list(frequency_list))
+
+    # Sample indexes of a loaded dataset follow the word order
+    frequencies = sorted(
+        (sample['word'], word_frequency(sample['word'], counts))
+        for sample in iter_dataset_samples(dataset_path))
+    ranks = FrequencyRanks.from_frequencies(
+        [frequency for _, frequency in frequencies])
+
+    if dataset_path.is_dir():
+        with open(dataset_path / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+            checksum = manifest_checksum(json.load(f)['shards'])
+    else:
+        checksum = words_checksum(word for word, _ in frequencies)
+    ranks.save(frequency_path(dataset_path), checksum)
+    return ranks
@@ -0,0 +1,302 @@
+"""A module with precomputed frequency ranks of dataset samples.
+
+`FrequencyRanks` orders samples by how often their words occur in a corpus
+(see `frequency` for how the ranks are computed). It keeps three arrays
+over sample indexes:
+    order     sample indexes, the most frequent first
+    ranks     a position of every sample in `order`
+    weights   frequency weights for random sampling
+
+The ranks are stored in a binary file next to the dataset
+(see `frequency_path`): a header with the number of samples and a checksum
+of the dataset, then the arrays as little-endian uint32. Ranks of a dataset
+that was changed after ranking do not match its checksum and are not used.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from pathlib import Path
+import random
+import re
+import struct
+import sys
+from typing import (
+    Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union)
+import zlib
+
+
+FREQUENCY_SUFFIX = '.freq'
+SHARDED_FREQUENCY_NAME = 'frequency.freq'
+HEADER = struct.Struct('<8sII')
+MAGIC = b'ENGFREQ1'
+MAX_WEIGHT = 2 ** 32 - 1
+
+
+def frequency_path(dataset_path: Union[Path, str]) -> Path:
+    """Get a path of the ranks file of a dataset.
+
+    It is `words.json.freq` for `words.json` and `frequency.freq` inside
+    the directory of a sharded dataset.
+    """
+    dataset_path = Path(dataset_path)
+    if dataset_path.is_dir():
+        return dataset_path / SHARDED_FREQUENCY_NAME
+    return dataset_path.with_name(dataset_path.name + FREQUENCY_SUFFIX)
+
+
+def words_checksum(words: Iterable[str]) -> int:
+    """Get a checksum of the words of a dataset in order of its indexes."""
+    return zlib.crc32('\n'.join(words).encode('utf-8'))
+
+
+def manifest_checksum(shards: List[Dict]) -> int:
+    """Get a checksum of a sharded dataset by its manifest's shards.
+
+    The shards' word ranges and counts change whenever a sample is added,
+    so the shards need not be loaded to check the ranks.
+    """
+    return words_checksum(f'{shard["first"]}\t{shard["last"]}\t'
+                          f'{shard["count"]}' for shard in shards)
+
+
+class FrequencyRanks:
+    """Samples of a dataset ordered by the frequency of their words."""
+
+    def __init__(self, order: array, ranks: array, weights: array) -> None:
+        """Create ranks from precomputed arrays.
+
+        Parameters
+        ----------
+        order : array
+            Sample indexes, the most frequent first.
+        ranks : array
+            A position of every sample in `order`.
+        weights : array
+            A positive weight of every sample for random sampling.
+        """
+        self.order = order
+        self.ranks = ranks
+        self.weights = weights
+        # Cumulative weights of all samples, built on the first weighted
+        # choice, and of the members of the last deck drawn from
+        self._cumulative: array = None
+        self._deck_weights: Tuple[int, array, array] = None
+
+    @classmethod
+    def from_frequencies(cls, frequencies: Sequence[int]) -> 'FrequencyRanks':
+        """Rank samples by their frequencies.
+
+        Samples of equal frequency keep the order of their indexes.
+
+        Parameters
+        ----------
+        frequencies : Sequence[int]
+            A frequency of every sample in order of the dataset indexes.
+
+        Returns
+        -------
+        FrequencyRanks
+            The ranks.
+        """
+        order = array('I', sorted(range(len(frequencies)),
+                                  key=frequencies.__getitem__, reverse=True))
+        ranks = array('I', bytes(order.itemsize * len(order)))
+        for rank, index in enumerate(order):
+            ranks[index] = rank
+        # Words that never occur may still be drawn
+        weights = array('I', (min(frequency + 1, MAX_WEIGHT)
+                              for frequency in frequencies))
+        return cls(order, ranks, weights)
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def append(self):
+        """Rank a sample added to the end of the dataset as the rarest."""
+        index = len(self.order)
+        self.order.append(index)
+        self.ranks.append(index)
+        self.weights.append(1)
+        self._cumulative = None
+        self._deck_weights = None
+
+    def next_index(self, index: int, deck: int = None) -> int:
+        """Get an index of the sample that is next by frequency.
+
+        Parameters
+        ----------
+        index : int
+            The index of the current sample.
+        deck : int, optional
+            A non-empty bitmap of sample indexes to walk over.
+            By default all samples are used.
+
+        Returns
+        -------
+        int
+            The next index. After the rarest sample goes the most
+            frequent one.
+        """
+        return self._step(index, 1, deck)
+
+    def previous_index(self, index: int, deck: int = None) -> int:
+        """Get an index of the sample that is previous by frequency.
+
+        Parameters
+        ----------
+        index : int
+            The index of the current sample.
+        deck : int, optional
+            A non-empty bitmap of sample indexes to walk over.
+            By default all samples are used.
+
+        Returns
+        -------
+        int
+            The previous index. Before the most frequent sample goes
+            the rarest one.
+        """
+        return self._step(index, -1, deck)
+
+    def _step(self, index: int, step: int, deck: int = None) -> int:
+        rank = self.ranks[index]
+        for _ in range(len(self.order)):
+            rank = (rank + step) % len(self.order)
+            index = self.order[rank]
+            if deck is None or deck >> index & 1:
+                return index
+        return index
+
+    def weighted_choice(
+        self,
+        deck: int = None,
+        exclude: Set[int] = None
+    ) -> int:
+        """Get a random sample index with probability of its weight.
+
+        Draws from a deck are weighted among the deck's members only.
+        The cumulative weights of the last deck are cached, so repeated
+        draws from one deck take a binary search.
+
+        Parameters
+        ----------
+        deck : int, optional
+            A bitmap of sample indexes to choose from.
+            By default all samples are used.
+        exclude : Set[int], optional
+            Indexes of samples to avoid.
+
+        Returns
+        -------
+        int
+            The index of the sample.
+
+        Raises
+        ------
+        IndexError
+            If there are no samples to choose from.
+        """
+        members, cumulative = self._weights_of(deck)
+        # The weight intervals of the excluded samples are cut out of the
+        # range to draw from
+        skipped = []
+        for index in exclude or ():
+            if members is None:
+                position = index
+            else:
+                position = bisect_left(members, index)
+                if position == len(members) or members[position] != index:
+                    continue
+            skipped.append((cumulative[position] - self.weights[index],
+                            cumulative[position]))
+        skipped.sort()
+        total = (cumulative[-1] if cumulative else 0) - sum(
+            end - start for start, end in skipped)
+        if total <= 0:
+            raise IndexError('There are no samples to choose from.')
+        point = random.randrange(total)
+        for start, end in skipped:
+            if point < start:
+                break
+            point += end - start
+        position = bisect_right(cumulative, point)
+        return position if members is None else members[position]
+
+    def _weights_of(self, deck: int = None) -> Tuple[Optional[array], array]:
+        """Get the members of a deck and their cumulative weights.
+
+        Members are `None` if the deck is all samples.
+        """
+        if deck is None:
+            if self._cumulative is None:
+                self._cumulative = array('Q', accumulate(self.weights))
+            return None, self._cumulative
+        if self._deck_weights is None or self._deck_weights[0] != deck:
+            bits = format(deck, 'b')[::-1]
+            members = array('I', (match.start()
+                                  for match in re.finditer('1', bits)))
+            cumulative = array('Q', accumulate(
+                self.weights[index] for index in members))
+            self._deck_weights = (deck, members, cumulative)
+        return self._deck_weights[1:]
+
+    def save(self, path: Union[Path, str], checksum: int):
+        """Write these ranks to a file.
+
+        Parameters
+        ----------
+        path : Union[Path, str]
+            The path of the file (see `frequency_path`).
+        checksum : int
+            The checksum of the ranked dataset.
+        """
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, len(self.order), checksum))
+            for values in (self.order, self.ranks, self.weights):
+                if sys.byteorder == 'big':
+                    values = array('I', values)
+                    values.byteswap()
+                values.tofile(f)
+
+    @classmethod
+    def load(
+        cls,
+        path: Union[Path, str],
+        checksum: int
+    ) -> Optional['FrequencyRanks']:
+        """Read ranks from a file if they match a dataset.
+
+        Parameters
+        ----------
+        path : Union[Path, str]
+            The path of the file (see `frequency_path`).
+        checksum : int
+            The checksum of the dataset to rank.
+
+        Returns
+        -------
+        Optional[FrequencyRanks]
+            The ranks or `None` if there is no such file or it was made
+            for another version of the dataset.
+        """
+        if not Path(path).exists():
+            return None
+        with open(path, 'rb') as f:
+            header = f.read(HEADER.size)
+            if len(header) < HEADER.size:
+                return None
+            magic, length, file_checksum = HEADER.unpack(header)
+            if magic != MAGIC or file_checksum != checksum:
+                return None
+            arrays = []
+            for _ in range(3):
+                values = array('I')
+                try:
+                    values.fromfile(f, length)
+                except EOFError:
+                    return None
+                if sys.byteorder == 'big':
+                    values.byteswap()
+                arrays.append(values)
+        return cls(*arrays)
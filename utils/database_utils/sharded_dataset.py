@@ -0,0 +1,522 @@
+"""A sharded `Dataset` module.
+
+A sharded dataset is a directory that contains shard files and a manifest:
+dataset_dir/
+    manifest.json
+    shard_00000.json
+    shard_00001.json
+    ...
+
+Shard files may be compressed in the same way as usual dataset files
+(see `file_io`), e.g. `shard_00000.json.gz`.
+
+Every shard file has the same format as a usual dataset file and contains
+the samples of one word range. The ranges do not overlap and the shards are
+ordered by them, so the samples of all shards in order are sorted by word.
+The manifest looks like below:
+{
+    'shards':
+    [
+        {
+            'file': str,
+            'count': int,
+            'first': str,
+            'last': str
+        },
+        ...
+    ]
+}
+
+`ShardedDataset` reads only the manifest at start and loads a shard the first
+time one of its samples is needed.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from itertools import accumulate, islice
+from pathlib import Path
+import json
+import random
+from typing import Dict, Iterator, List, Optional, Set, Union
+
+from utils.database_utils.dataset import (
+    Dataset, make_sample, sample_type, sample_word, samples_list)
+from utils.database_utils.dataset_view import DatasetView
+from utils.database_utils.file_io import (
+    iter_samples, read_samples, write_samples)
+from utils.database_utils.frequency_ranks import manifest_checksum
+
+
+MANIFEST_NAME = 'manifest.json'
+shard_info = Dict[str, Union[str, int]]
+
+
+class ShardedDataset(Dataset):
+    """A `Dataset` stored in several shard files that are loaded lazily.
+
+    Numeric indexes refer to the samples sorted by word. Unlike `Dataset`,
+    `add_sample` inserts a new sample at its sorted position, so indexes of
+    the following samples are shifted.
+    """
+
+    def __init__(self, dataset_dir: Union[Path, str]) -> None:
+        if isinstance(dataset_dir, str):
+            dataset_dir = Path(dataset_dir)
+        manifest_path = dataset_dir / MANIFEST_NAME
+        if not manifest_path.exists():
+            raise FileExistsError(
+                f'The dataset manifest {manifest_path} does not exists.')
+        self.dataset_path = dataset_dir
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        self._shards: List[shard_info] = manifest['shards']
+
+        self._loaded_shards: Dict[int, samples_list] = {}
+        self._shard_word_to_idx: Dict[int, Dict[str, int]] = {}
+        self._dirty_shards: Set[int] = set()
+        self._update_offsets()
+        # Built on the first deck query, which loads all the shards
+        self._deck_index = None
+        self._change_listeners = []
+        # Samples are always inserted at their sorted position
+        self._sorted = True
+        self._frequency_ranks = None
+        self._frequency_ranks_read = False
+
+    def _update_offsets(self):
+        """Recount the first global index and the first word of the shards."""
+        self._offsets = [0] + list(
+            accumulate(shard['count'] for shard in self._shards))
+        self._first_words = [shard['first'] for shard in self._shards]
+
+    def _load_shard(self, shard_idx: int) -> samples_list:
+        """Get samples of a shard reading its file if it is not loaded yet.
+
+        Parameters
+        ----------
+        shard_idx : int
+            An index of the shard.
+
+        Returns
+        -------
+        samples_list
+            The shard's samples sorted by word.
+        """
+        samples = self._loaded_shards.get(shard_idx)
+        if samples is None:
+            samples = read_samples(
+                self.dataset_path / self._shards[shard_idx]['file'])
+            samples.sort(key=sample_word)
+            self._loaded_shards[shard_idx] = samples
+            self._shard_word_to_idx[shard_idx] = {
+                sample['word']: i for i, sample in enumerate(samples)}
+        return samples
+
+    def _find_shard(self, word: str) -> int:
+        """Get an index of the shard whose word range may contain a word.
+
+        A word that is out of all ranges belongs to the nearest previous
+        shard, or to the first one if it precedes all ranges.
+        """
+        return max(bisect_right(self._first_words, word) - 1, 0)
+
+    def _locate(self, word: str) -> Optional[int]:
+        """Get an index of the shard that contains a given word.
+
+        Shards are loaded only if the word is inside their range.
+
+        Returns
+        -------
+        Optional[int]
+            The shard index or `None` if there is no such word.
+        """
+        if len(self._shards) == 0:
+            return None
+        shard_idx = self._find_shard(word)
+        shard = self._shards[shard_idx]
+        if not shard['first'] <= word <= shard['last']:
+            return None
+        self._load_shard(shard_idx)
+        if word not in self._shard_word_to_idx[shard_idx]:
+            return None
+        return shard_idx
+
+    def __len__(self) -> int:
+        return self._offsets[-1]
+
+    def __iter__(self) -> Iterator[sample_type]:
+        for shard_idx in range(len(self._shards)):
+            yield from self._load_shard(shard_idx)
+
+    def _iter_range(self, indexes: range) -> Iterator[sample_type]:
+        """Iterate over the samples of a range of numeric indexes.
+
+        Only the shards that overlap the range are loaded.
+        """
+        if indexes.step != 1:
+            yield from map(self.__getitem__, indexes)
+            return
+        index = indexes.start
+        shard_idx = bisect_right(self._offsets, index) - 1
+        while index < indexes.stop and shard_idx < len(self._shards):
+            offset = self._offsets[shard_idx]
+            yield from islice(self._load_shard(shard_idx),
+                              index - offset, indexes.stop - offset)
+            shard_idx += 1
+            index = self._offsets[shard_idx]
+
+    def _checksum(self) -> int:
+        """Get a checksum of this dataset by its manifest, so that checking
+        frequency ranks does not load the shards."""
+        return manifest_checksum(self._shards)
+
+    def _bisect_word(self, word: str) -> int:
+        """Get an index of the first sample whose word is not less than
+        a given one. Only the shard whose range contains the word
+        is loaded."""
+        if len(self._shards) == 0:
+            return 0
+        shard_idx = self._find_shard(word)
+        shard = self._shards[shard_idx]
+        if word <= shard['first']:
+            return self._offsets[shard_idx]
+        if word > shard['last']:
+            return self._offsets[shard_idx + 1]
+        return self._offsets[shard_idx] + bisect_left(
+            self._load_shard(shard_idx), word, key=sample_word)
+
+    def __getitem__(
+        self,
+        index: Union[int, str, slice]
+    ) -> Union[sample_type, DatasetView]:
+        """Return a sample from this dataset by a word or a numeric index.
+
+        Only the shard that contains the sample is loaded.
+
+        Parameters
+        ----------
+        index : Union[int, str, slice]
+            Index for the sample getting. A slice gives a lazy view
+            of the samples that loads shards while it is iterated.
+
+        Returns
+        -------
+        Union[sample_type, DatasetView]
+            The required sample or the view.
+        """
+        if isinstance(index, slice):
+            return DatasetView(self, range(len(self))[index])
+        if isinstance(index, str):
+            index = self.get_word_index(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Dataset index out of range.')
+        shard_idx = bisect_right(self._offsets, index) - 1
+        samples = self._load_shard(shard_idx)
+        return samples[index - self._offsets[shard_idx]]
+
+    def __contains__(self, word: str) -> bool:
+        """Check whether a given word is in this dataset.
+
+        Parameters
+        ----------
+        word : str
+            The word to check.
+
+        Returns
+        -------
+        bool
+            Whether the given word is in this dataset.
+        """
+        return self._locate(word) is not None
+
+    def get_word_index(self, word: str) -> int:
+        """Get an index of given word's sample in this dataset.
+
+        Parameters
+        ----------
+        word : str
+            The word whose index is to be obtained.
+
+        Returns
+        -------
+        int
+            The index of given word.
+        """
+        shard_idx = self._locate(word)
+        if shard_idx is None:
+            raise KeyError(word)
+        return (self._offsets[shard_idx] +
+                self._shard_word_to_idx[shard_idx][word])
+
+    def random_choice(
+        self,
+        exclude: List[str] = None,
+        deck: int = None,
+        weighted: bool = False
+    ) -> sample_type:
+        """Get a random sample from this dataset.
+
+        Without a deck and frequency weights, a shard is chosen with
+        a probability proportional to its size and then a sample is chosen
+        inside it, so every sample is equally likely and only one shard
+        is loaded.
+
+        Parameters
+        ----------
+        exclude : List[str], optional
+            A list of words to avoid when getting a random sample.
+        deck : int, optional
+            A bitmap of sample indexes to choose from (see `select`).
+            By default all samples are used.
+        weighted : bool, optional
+            Whether to draw frequent words more often (see
+            `frequency_ranks`). By default is `False`.
+
+        Returns
+        -------
+        sample_type
+            The random sample.
+
+        Raises
+        ------
+        IndexError
+            If there are no samples to choose from.
+        ValueError
+            If `weighted` is set but this dataset has no frequency ranks.
+        """
+        if deck is not None or weighted:
+            return super().random_choice(exclude, deck, weighted)
+        excluded = set(exclude) if exclude else set()
+        if len(self) - len(excluded) <= 0:
+            raise IndexError('There are no samples to choose from.')
+        while True:
+            shard_idx = random.choices(
+                range(len(self._shards)), cum_weights=self._offsets[1:])[0]
+            sample = random.choice(self._load_shard(shard_idx))
+            if sample['word'] not in excluded:
+                return sample
+
+    def add_sample(
+        self,
+        word: str,
+        translates: List[str],
+        example_eng: str,
+        example_rus: str,
+        tags: List[str] = None,
+        deck: str = None
+    ) -> None:
+        """Add a given sample to this dataset.
+
+        The sample is inserted into the shard whose range is the nearest to
+        the word, so only this shard is loaded and later rewritten.
+        Indexes of the following samples are shifted, so bitmaps got from
+        `select` before become invalid.
+
+        Parameters
+        ----------
+        word : str
+            The word string of the sample.
+        translates : List[str]
+            A list of translates of the sample.
+        example_eng : str
+            An english example string of the sample.
+        example_rus : str
+            A russian example string of the sample.
+        tags : List[str], optional
+            Tags of the sample.
+        deck : str, optional
+            A deck of the sample.
+        """
+        if len(self._shards) == 0:
+            self._shards.append({'file': shard_file_name(0), 'count': 0,
+                                 'first': word, 'last': word})
+            self._loaded_shards[0] = []
+            self._shard_word_to_idx[0] = {}
+        shard_idx = self._find_shard(word)
+        samples = self._load_shard(shard_idx)
+        insort(samples,
+               make_sample(word, translates, example_eng, example_rus,
+                           tags, deck),
+               key=sample_word)
+        self._shard_word_to_idx[shard_idx] = {
+            sample['word']: i for i, sample in enumerate(samples)}
+
+        shard = self._shards[shard_idx]
+        shard['count'] = len(samples)
+        shard['first'] = samples[0]['word']
+        shard['last'] = samples[-1]['word']
+        self._dirty_shards.add(shard_idx)
+        self._update_offsets()
+        self._deck_index = None
+        # The ranks do not match the shifted indexes anymore
+        self._frequency_ranks = None
+        self._frequency_ranks_read = True
+        self._notify_change(word)
+
+    def add_tags(self, word: str, tags: List[str]):
+        """Add tags to a sample of this dataset.
+
+        Parameters
+        ----------
+        word : str
+            The word of the sample.
+        tags : List[str]
+            The tags to add.
+        """
+        super().add_tags(word, tags)
+        self._dirty_shards.add(self._locate(word))
+
+    def remove_example(self, word: str, example_idx: int):
+        """Remove an example from a sample of this dataset.
+
+        Parameters
+        ----------
+        word : str
+            The word of the sample.
+        example_idx : int
+            An index of the example in the sample's examples.
+
+        Raises
+        ------
+        ValueError
+            If it is the last example of the sample.
+        """
+        super().remove_example(word, example_idx)
+        self._dirty_shards.add(self._locate(word))
+
+    def save_dataset(self, save_path: Union[Path, str] = None):
+        """Save this dataset to a directory of shards.
+
+        Saving to the directory this dataset was loaded from rewrites only
+        the shards that were changed. Saving to another directory writes
+        all the shards.
+
+        Parameters
+        ----------
+        save_path : Union[Path, str], optional
+            A directory for saving. By default is the directory this dataset
+            was loaded from.
+        """
+        if save_path is None:
+            save_path = self.dataset_path
+        if isinstance(save_path, str):
+            save_path = Path(save_path)
+        save_path.mkdir(parents=True, exist_ok=True)
+        if save_path.resolve() == self.dataset_path.resolve():
+            shards_to_save = sorted(self._dirty_shards)
+        else:
+            shards_to_save = range(len(self._shards))
+
+        for shard_idx in shards_to_save:
+            write_samples(self._load_shard(shard_idx),
+                          save_path / self._shards[shard_idx]['file'])
+        write_manifest(save_path, self._shards)
+        if save_path.resolve() == self.dataset_path.resolve():
+            self._dirty_shards.clear()
+
+
+def shard_file_name(shard_idx: int, suffix: str = '.json') -> str:
+    """Get a file name of a shard with a given index and file extension."""
+    return f'shard_{shard_idx:05d}{suffix}'
+
+
+def write_manifest(dataset_dir: Path, shards: List[shard_info]):
+    """Write a manifest of a sharded dataset.
+
+    Parameters
+    ----------
+    dataset_dir : Path
+        The directory of the sharded dataset.
+    shards : List[shard_info]
+        Descriptions of the shards in order of their word ranges.
+    """
+    with open(dataset_dir / MANIFEST_NAME, 'w', encoding='utf-8') as f:
+        json.dump({'shards': shards}, f, indent=4, ensure_ascii=False)
+
+
+def make_shards(
+    dataset: Dataset,
+    save_dir: Union[Path, str],
+    shard_size: int = 1000,
+    suffix: str = '.json'
+):
+    """Split a dataset into a directory of shards.
+
+    Samples are sorted by word and cut into consecutive word ranges
+    of `shard_size` samples. A sorted dataset is cut by slice views
+    without copying its samples into a new list.
+
+    Parameters
+    ----------
+    dataset : Dataset
+        The dataset to split.
+    save_dir : Union[Path, str]
+        A directory for the shards and the manifest.
+    shard_size : int, optional
+        A number of samples in one shard. By default is equal 1000.
+    suffix : str, optional
+        An extension of the shard files, e.g. `'.json.gz'` for compressed
+        shards. By default is `'.json'`.
+    """
+    if isinstance(save_dir, str):
+        save_dir = Path(save_dir)
+    save_dir.mkdir(parents=True, exist_ok=True)
+    if dataset.is_sorted:
+        samples = dataset
+    else:
+        samples = sorted(dataset, key=sample_word)
+    shards = []
+    for start in range(0, len(samples), shard_size):
+        shard_samples = samples[start:start + shard_size]
+        shard = {'file': shard_file_name(len(shards), suffix),
+                 'count': len(shard_samples),
+                 'first': shard_samples[0]['word'],
+                 'last': shard_samples[-1]['word']}
+        write_samples(shard_samples, save_dir / shard['file'])
+        shards.append(shard)
+    write_manifest(save_dir, shards)
+
+
+def load_dataset(dataset_path: Union[Path, str]) -> Dataset:
+    """Open a dataset file or a directory of a sharded dataset.
+
+    Parameters
+    ----------
+    dataset_path : Union[Path, str]
+        A path to a dataset file or to a sharded dataset directory.
+
+    Returns
+    -------
+    Dataset
+        `ShardedDataset` for a directory and `Dataset` otherwise.
+    """
+    if Path(dataset_path).is_dir():
+        return ShardedDataset(dataset_path)
+    return Dataset(dataset_path)
+
+
+def iter_dataset_samples(dataset_path: Union[Path, str]) -> Iterator[Dict]:
+    """Read samples of a dataset file or a sharded dataset one by one.
+
+    Unlike `load_dataset`, nothing is kept in memory after a sample
+    is yielded. Samples of a sharded dataset come in order of the shards.
+
+    Parameters
+    ----------
+    dataset_path : Union[Path, str]
+        A path to a dataset file or to a sharded dataset directory.
+
+    Yields
+    ------
+    Dict
+        The next sample.
+    """
+    dataset_path = Path(dataset_path)
+    if not dataset_path.is_dir():
+        yield from iter_samples(dataset_path)
+        return
+    with open(dataset_path / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+        shards = json.load(f)['shards']
+    for shard in shards:
+        yield from iter_samples(dataset_path / shard['file'])
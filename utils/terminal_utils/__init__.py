@@ -0,0 +1,5 @@
+"""
+A package contains tools for drilling words in a terminal without Qt.
+"""
+
+from utils.terminal_utils.drill import TerminalDrill, read_key  # noqa
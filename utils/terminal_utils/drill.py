@@ -0,0 +1,234 @@
+"""A terminal drill module.
+
+`TerminalDrill` shows samples of a `Dataset` as cards in a terminal and lets
+a user walk through them with single key presses. The module uses only the
+standard library, so it can be used on machines without Qt (e.g. over ssh).
+
+Keys:
+    space, enter  show or hide the translate and the example
+    n, right      the next sample
+    p, left       the previous sample
+    r             a random sample
+    ], [          the next or the previous example of the sample
+    a             add a new sample
+    q             quit
+"""
+
+from pathlib import Path
+import sys
+from typing import Any, Callable, Union
+
+from utils.database_utils import (
+    Dataset, parse_tags, sample_type, validate_label)
+
+
+CLEAR_SCREEN = '\033[2J\033[H'
+ARROW_KEYS = {'\x1b[C': 'right', '\x1b[D': 'left',
+              '\x1b[A': 'up', '\x1b[B': 'down'}
+HELP_LINE = ('space: show  n/p: next/previous  r: random  '
+             '[/]: examples  a: add  q: quit')
+
+
+def read_key() -> str:
+    """Read a single key press from the terminal without waiting for enter.
+
+    Returns
+    -------
+    str
+        The pressed character, or `'right'`, `'left'`, `'up'`, `'down'`
+        for the arrow keys.
+    """
+    try:
+        import termios
+        import tty
+    except ImportError:
+        # Windows
+        import msvcrt
+        key = msvcrt.getwch()
+        if key in ('\x00', '\xe0'):
+            return {'M': 'right', 'K': 'left',
+                    'H': 'up', 'P': 'down'}.get(msvcrt.getwch(), '')
+        return key
+
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setraw(fd)
+        key = sys.stdin.read(1)
+        if key == '\x1b':
+            key += sys.stdin.read(2)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+    return ARROW_KEYS.get(key, key)
+
+
+class TerminalDrill:
+    """An interactive terminal loop over a `Dataset`."""
+
+    def __init__(
+        self,
+        dataset: Dataset,
+        save_path: Union[Path, str],
+        deck_query: str = None,
+        key_reader: Callable[[], str] = read_key
+    ) -> None:
+        """Create a terminal drill.
+
+        Parameters
+        ----------
+        dataset : Dataset
+            The dataset to drill.
+        save_path : Union[Path, str]
+            A path where the dataset is saved if any sample was added.
+        deck_query : str, optional
+            A deck query to drill only matching samples, e.g. `'ml & week'`.
+            By default all samples are drilled.
+        key_reader : Callable[[], str], optional
+            A function that returns a next pressed key.
+            By default is `read_key`.
+        """
+        self.dataset = dataset
+        self.save_path = save_path
+        self._read_key = key_reader
+        self._deck_query = deck_query
+        self._deck = None
+        if deck_query is not None:
+            self._deck = dataset.select(deck_query)
+            if self._deck == 0:
+                raise ValueError(f'No words match "{deck_query}".')
+
+        # Service variables
+        self._current_sample: sample_type = self.dataset.random_choice(
+            deck=self._deck)
+        self._current_example = 0
+        self._revealed = False
+        self._modified = False
+
+    def run(self):
+        """Show cards and handle key presses until the user quits."""
+        actions = {
+            'n': self._next_sample, 'right': self._next_sample,
+            'p': self._previous_sample, 'left': self._previous_sample,
+            'r': self._random_sample,
+            ']': self._next_example, '[': self._previous_example,
+            ' ': self._toggle_reveal, '\r': self._toggle_reveal,
+            '\n': self._toggle_reveal,
+            'a': self._add_sample
+        }
+        while True:
+            self._show_card()
+            key = self._read_key()
+            if key in ('q', '\x03', '\x04'):
+                break
+            action = actions.get(key)
+            if action is not None:
+                action()
+        if self._modified:
+            self.dataset.save_dataset(self.save_path)
+
+    def _show_card(self):
+        """Print the current sample."""
+        sample = self._current_sample
+        lines = [CLEAR_SCREEN + sample['word'].capitalize(), '']
+        if self._revealed:
+            examples = sample['examples']
+            example = examples[self._current_example]
+            lines += [', '.join(sample['translates']).capitalize(), '',
+                      f'Example {self._current_example + 1}/'
+                      f'{len(examples)}',
+                      example['example_eng'],
+                      example['example_rus']]
+        else:
+            lines.append('...')
+        lines += ['', HELP_LINE]
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
+
+    def _set_sample(self, sample: sample_type):
+        self._current_sample = sample
+        self._current_example = 0
+        self._revealed = False
+
+    def _next_sample(self):
+        current_idx = self.dataset.get_word_index(self._current_sample['word'])
+        current_idx = self.dataset.next_index(current_idx, self._deck)
+        self._set_sample(self.dataset[current_idx])
+
+    def _previous_sample(self):
+        current_idx = self.dataset.get_word_index(self._current_sample['word'])
+        current_idx = self.dataset.previous_index(current_idx, self._deck)
+        self._set_sample(self.dataset[current_idx])
+
+    def _random_sample(self):
+        current_word = self._current_sample['word']
+        try:
+            sample = self.dataset.random_choice([current_word], self._deck)
+        except IndexError:
+            # The current sample is the only one in the deck
+            return
+        self._set_sample(sample)
+
+    def _next_example(self):
+        examples = self._current_sample['examples']
+        self._current_example = (self._current_example + 1) % len(examples)
+
+    def _previous_example(self):
+        examples = self._current_sample['examples']
+        self._current_example = (self._current_example - 1) % len(examples)
+
+    def _toggle_reveal(self):
+        self._revealed = not self._revealed
+
+    def _input_optional(self, prompt: str, parse: Callable[[str], Any]):
+        """Ask for an optional field until it is empty or can be parsed.
+
+        Parameters
+        ----------
+        prompt : str
+            The prompt.
+        parse : Callable[[str], Any]
+            A function that parses the input or raises `ValueError`.
+
+        Returns
+        -------
+        Any
+            The parsed input, `None` if it is empty.
+        """
+        while True:
+            text = input(prompt).strip()
+            if text == '':
+                return None
+            try:
+                return parse(text)
+            except ValueError as error:
+                print(error)
+
+    def _add_sample(self):
+        """Ask for a new sample's fields and add it to the dataset."""
+        sys.stdout.write(CLEAR_SCREEN + 'Add a new sample '
+                         '(leave a field empty to cancel)\n\n')
+        fields = []
+        for prompt in ['Word: ', 'Translates (comma separated): ',
+                       'Example sentence: ', 'Example translate: ']:
+            text = input(prompt).strip()
+            if text == '':
+                return
+            fields.append(text)
+        word, translate, example_eng, example_rus = fields
+        word = word.lower()
+        if word in self.dataset:
+            input(f'"{word}" is already in the dictionary. '
+                  'Press enter to continue.')
+            return
+        translate = [trans.strip().lower() for trans in translate.split(',')]
+        tags = self._input_optional(
+            'Tags (optional, space or comma separated): ', parse_tags)
+        deck = self._input_optional('Deck (optional): ', validate_label)
+        self.dataset.add_sample(word, translate, example_eng, example_rus,
+                                tags, deck)
+        self._modified = True
+        if self._deck is not None:
+            # Adding may shift sample indexes of the deck's bitmap
+            self._deck = self.dataset.select(self._deck_query)
+        self._set_sample(self.dataset[word])
+        self._revealed = True
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'AddSamplePage.ui'
+##
+## Created by: Qt User Interface Compiler version 6.2.4
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QFormLayout, QHBoxLayout, QLabel,
+    QLineEdit, QPushButton, QSizePolicy, QTextEdit,
+    QWidget)
+
+class Ui_AddSamplePage(object):
+    def setupUi(self, AddSamplePage):
+        if not AddSamplePage.objectName():
+            AddSamplePage.setObjectName(u"AddSamplePage")
+        AddSamplePage.resize(591, 471)
+        self.layoutWidget = QWidget(AddSamplePage)
+        self.layoutWidget.setObjectName(u"layoutWidget")
+        self.layoutWidget.setGeometry(QRect(0, 60, 591, 360))
+        self.sampleAddMidPanelFormLayout = QFormLayout(self.layoutWidget)
+        self.sampleAddMidPanelFormLayout.setObjectName(u"sampleAddMidPanelFormLayout")
+        self.sampleAddMidPanelFormLayout.setHorizontalSpacing(10)
+        self.sampleAddMidPanelFormLayout.setVerticalSpacing(10)
+        self.sampleAddMidPanelFormLayout.setContentsMargins(0, 10, 0, 10)
+        self.newWordLineEdit = QLineEdit(self.layoutWidget)
+        self.newWordLineEdit.setObjectName(u"newWordLineEdit")
+        self.newWordLineEdit.setEnabled(True)
+        sizePolicy1 = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.newWordLineEdit.sizePolicy().hasHeightForWidth())
+        self.newWordLineEdit.setSizePolicy(sizePolicy1)
+        self.newWordLineEdit.setMinimumSize(QSize(350, 0))
+        self.newWordLineEdit.setReadOnly(False)
+
+        self.sampleAddMidPanelFormLayout.setWidget(0, QFormLayout.LabelRole, self.newWordLineEdit)
+
+        self.newWordMsgLabel = QLabel(self.layoutWidget)
+        self.newWordMsgLabel.setObjectName(u"newWordMsgLabel")
+
+        self.sampleAddMidPanelFormLayout.setWidget(0, QFormLayout.FieldRole, self.newWordMsgLabel)
+
+        self.newWordTranslateTextEdit = QTextEdit(self.layoutWidget)
+        self.newWordTranslateTextEdit.setObjectName(u"newWordTranslateTextEdit")
+        self.newWordTranslateTextEdit.setEnabled(True)
+        self.newWordTranslateTextEdit.setMinimumSize(QSize(350, 60))
+        self.newWordTranslateTextEdit.setTabChangesFocus(True)
+        self.newWordTranslateTextEdit.setReadOnly(False)
+
+        self.sampleAddMidPanelFormLayout.setWidget(1, QFormLayout.LabelRole, self.newWordTranslateTextEdit)
+
+        self.newWordTranslateMsgLabel = QLabel(self.layoutWidget)
+        self.newWordTranslateMsgLabel.setObjectName(u"newWordTranslateMsgLabel")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.newWordTranslateMsgLabel.sizePolicy().hasHeightForWidth())
+        self.newWordTranslateMsgLabel.setSizePolicy(sizePolicy2)
+
+        self.sampleAddMidPanelFormLayout.setWidget(1, QFormLayout.FieldRole, self.newWordTranslateMsgLabel)
+
+        self.newWordExampleEngTextEdit = QTextEdit(self.layoutWidget)
+        self.newWordExampleEngTextEdit.setObjectName(u"newWordExampleEngTextEdit")
+        self.newWordExampleEngTextEdit.setEnabled(True)
+        self.newWordExampleEngTextEdit.setMinimumSize(QSize(350, 70))
+        self.newWordExampleEngTextEdit.setTabChangesFocus(True)
+        self.newWordExampleEngTextEdit.setReadOnly(False)
+
+        self.sampleAddMidPanelFormLayout.setWidget(2, QFormLayout.LabelRole, self.newWordExampleEngTextEdit)
+
+        self.newWordExampleRusTextEdit = QTextEdit(self.layoutWidget)
+        self.newWordExampleRusTextEdit.setObjectName(u"newWordExampleRusTextEdit")
+        self.newWordExampleRusTextEdit.setEnabled(True)
+        self.newWordExampleRusTextEdit.setMinimumSize(QSize(350, 70))
+        self.newWordExampleRusTextEdit.setTabChangesFocus(True)
+        self.newWordExampleRusTextEdit.setReadOnly(False)
+
+        self.sampleAddMidPanelFormLayout.setWidget(3, QFormLayout.LabelRole, self.newWordExampleRusTextEdit)
+
+        self.newWordExampleRusMsgLabel = QLabel(self.layoutWidget)
+        self.newWordExampleRusMsgLabel.setObjectName(u"newWordExampleRusMsgLabel")
+        sizePolicy2.setHeightForWidth(self.newWordExampleRusMsgLabel.sizePolicy().hasHeightForWidth())
+        self.newWordExampleRusMsgLabel.setSizePolicy(sizePolicy2)
+
+        self.sampleAddMidPanelFormLayout.setWidget(3, QFormLayout.FieldRole, self.newWordExampleRusMsgLabel)
+
+        self.newWordExampleEngMsgLabel = QLabel(self.layoutWidget)
+        self.newWordExampleEngMsgLabel.setObjectName(u"newWordExampleEngMsgLabel")
+        sizePolicy2.setHeightForWidth(self.newWordExampleEngMsgLabel.sizePolicy().hasHeightForWidth())
+        self.newWordExampleEngMsgLabel.setSizePolicy(sizePolicy2)
+
+        self.sampleAddMidPanelFormLayout.setWidget(2, QFormLayout.FieldRole, self.newWordExampleEngMsgLabel)
+
+        self.newWordTagsLineEdit = QLineEdit(self.layoutWidget)
+        self.newWordTagsLineEdit.setObjectName(u"newWordTagsLineEdit")
+        self.newWordTagsLineEdit.setMinimumSize(QSize(350, 0))
+
+        self.sampleAddMidPanelFormLayout.setWidget(4, QFormLayout.LabelRole, self.newWordTagsLineEdit)
+
+        self.newWordTagsMsgLabel = QLabel(self.layoutWidget)
+        self.newWordTagsMsgLabel.setObjectName(u"newWordTagsMsgLabel")
+
+        self.sampleAddMidPanelFormLayout.setWidget(4, QFormLayout.FieldRole, self.newWordTagsMsgLabel)
+
+        self.newWordDeckLineEdit = QLineEdit(self.layoutWidget)
+        self.newWordDeckLineEdit.setObjectName(u"newWordDeckLineEdit")
+        self.newWordDeckLineEdit.setMinimumSize(QSize(350, 0))
+
+        self.sampleAddMidPanelFormLayout.setWidget(5, QFormLayout.LabelRole, self.newWordDeckLineEdit)
+
+        self.newWordDeckMsgLabel = QLabel(self.layoutWidget)
+        self.newWordDeckMsgLabel.setObjectName(u"newWordDeckMsgLabel")
+
+        self.sampleAddMidPanelFormLayout.setWidget(5, QFormLayout.FieldRole, self.newWordDeckMsgLabel)
+
+        self.horizontalLayoutWidget = QWidget(AddSamplePage)
+        self.horizontalLayoutWidget.setObjectName(u"horizontalLayoutWidget")
+        self.horizontalLayoutWidget.setGeometry(QRect(110, 420, 401, 51))
+        self.AddSamplePageBottomPanelHorizontalLayout = QHBoxLayout(self.horizontalLayoutWidget)
+        self.AddSamplePageBottomPanelHorizontalLayout.setSpacing(15)
+        self.AddSamplePageBottomPanelHorizontalLayout.setObjectName(u"AddSamplePageBottomPanelHorizontalLayout")
+        self.AddSamplePageBottomPanelHorizontalLayout.setContentsMargins(10, 5, 10, 5)
+        self.fromAddToMainPushButton = QPushButton(self.horizontalLayoutWidget)
+        self.fromAddToMainPushButton.setObjectName(u"fromAddToMainPushButton")
+
+        self.AddSamplePageBottomPanelHorizontalLayout.addWidget(self.fromAddToMainPushButton)
+
+        self.clearAddSamplePageButton = QPushButton(self.horizontalLayoutWidget)
+        self.clearAddSamplePageButton.setObjectName(u"clearAddSamplePageButton")
+
+        self.AddSamplePageBottomPanelHorizontalLayout.addWidget(self.clearAddSamplePageButton)
+
+        self.horizontalLayoutWidget_3 = QWidget(AddSamplePage)
+        self.horizontalLayoutWidget_3.setObjectName(u"horizontalLayoutWidget_3")
+        self.horizontalLayoutWidget_3.setGeometry(QRect(0, 0, 521, 51))
+        self.sampleAddPageTopPanelHorizontalLayout = QHBoxLayout(self.horizontalLayoutWidget_3)
+        self.sampleAddPageTopPanelHorizontalLayout.setSpacing(20)
+        self.sampleAddPageTopPanelHorizontalLayout.setObjectName(u"sampleAddPageTopPanelHorizontalLayout")
+        self.sampleAddPageTopPanelHorizontalLayout.setContentsMargins(10, 5, 10, 5)
+        self.wordZoneTitleLabel = QLabel(self.horizontalLayoutWidget_3)
+        self.wordZoneTitleLabel.setObjectName(u"wordZoneTitleLabel")
+        font = QFont()
+        font.setPointSize(14)
+        self.wordZoneTitleLabel.setFont(font)
+
+        self.sampleAddPageTopPanelHorizontalLayout.addWidget(self.wordZoneTitleLabel)
+
+        self.saveNewSampleButton = QPushButton(self.horizontalLayoutWidget_3)
+        self.saveNewSampleButton.setObjectName(u"saveNewSampleButton")
+
+        self.sampleAddPageTopPanelHorizontalLayout.addWidget(self.saveNewSampleButton)
+
+        self.successful_save_label = QLabel(self.horizontalLayoutWidget_3)
+        self.successful_save_label.setObjectName(u"successful_save_label")
+        self.successful_save_label.setStyleSheet(u"QLabel { color : green; }")
+
+        self.sampleAddPageTopPanelHorizontalLayout.addWidget(self.successful_save_label)
+
+        self.retranslateUi(AddSamplePage)
+
+        QMetaObject.connectSlotsByName(AddSamplePage)
+    # setupUi
+
+    def retranslateUi(self, AddSamplePage):
+        AddSamplePage.setWindowTitle(QCoreApplication.translate("AddSamplePage", u"Form", None))
+#if QT_CONFIG(tooltip)
+        self.newWordLineEdit.setToolTip("")
+#endif // QT_CONFIG(tooltip)
+        self.newWordLineEdit.setText("")
+        self.newWordMsgLabel.setText(QCoreApplication.translate("AddSamplePage", u"Type a new word", None))
+        self.newWordTranslateTextEdit.setDocumentTitle("")
+        self.newWordTranslateMsgLabel.setText(QCoreApplication.translate("AddSamplePage", u"Type the word's translates", None))
+        self.newWordExampleRusMsgLabel.setText(QCoreApplication.translate("AddSamplePage", u"Type a translate of\n"
+"the example sentance", None))
+        self.newWordExampleEngMsgLabel.setText(QCoreApplication.translate("AddSamplePage", u"Type an example sentance\n"
+"that contains the word", None))
+        self.newWordTagsLineEdit.setPlaceholderText(QCoreApplication.translate("AddSamplePage", u"e.g. ml week-42", None))
+        self.newWordTagsMsgLabel.setText(QCoreApplication.translate("AddSamplePage", u"Tags, optional", None))
+        self.newWordDeckLineEdit.setPlaceholderText(QCoreApplication.translate("AddSamplePage", u"e.g. papers", None))
+        self.newWordDeckMsgLabel.setText(QCoreApplication.translate("AddSamplePage", u"Deck, optional", None))
+        self.fromAddToMainPushButton.setText(QCoreApplication.translate("AddSamplePage", u"Back to dictionary", None))
+        self.clearAddSamplePageButton.setText(QCoreApplication.translate("AddSamplePage", u"Clear inputs", None))
+        self.wordZoneTitleLabel.setText(QCoreApplication.translate("AddSamplePage", u"Word and translate", None))
+        self.saveNewSampleButton.setText(QCoreApplication.translate("AddSamplePage", u"Add to dictionary", None))
+        self.successful_save_label.setText(QCoreApplication.translate("AddSamplePage", u"Successfully", None))
+    # retranslateUi
+
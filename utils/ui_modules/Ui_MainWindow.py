@@ -11,12 +11,13 @@
 from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
     QMetaObject, QObject, QPoint, QRect,
     QSize, QTime, QUrl, Qt)
-from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
-    QFont, QFontDatabase, QGradient, QIcon,
-    QImage, QKeySequence, QLinearGradient, QPainter,
-    QPalette, QPixmap, QRadialGradient, QTransform)
-from PySide6.QtWidgets import (QApplication, QFormLayout, QHBoxLayout, QLabel,
-    QLineEdit, QMainWindow, QMenuBar, QPushButton,
+from PySide6.QtGui import (QAction, QBrush, QColor, QConicalGradient,
+    QCursor, QFont, QFontDatabase, QGradient,
+    QIcon, QImage, QKeySequence, QLinearGradient,
+    QPainter, QPalette, QPixmap, QRadialGradient,
+    QTransform)
+from PySide6.QtWidgets import (QApplication, QHBoxLayout, QLabel, QLineEdit,
+    QMainWindow, QMenu, QMenuBar, QPushButton,
     QSizePolicy, QStackedWidget, QStatusBar, QTextEdit,
     QVBoxLayout, QWidget)
 
@@ -33,6 +34,21 @@ class Ui_MainWindow(object):
         font = QFont()
         font.setPointSize(12)
         MainWindow.setFont(font)
+        self.actionFilterDeck = QAction(MainWindow)
+        self.actionFilterDeck.setObjectName(u"actionFilterDeck")
+        self.actionShowAllWords = QAction(MainWindow)
+        self.actionShowAllWords.setObjectName(u"actionShowAllWords")
+        self.actionFrequencyOrder = QAction(MainWindow)
+        self.actionFrequencyOrder.setObjectName(u"actionFrequencyOrder")
+        self.actionFrequencyOrder.setCheckable(True)
+        self.actionQuizMode = QAction(MainWindow)
+        self.actionQuizMode.setObjectName(u"actionQuizMode")
+        self.actionQuizMode.setCheckable(True)
+        self.actionCheckAnswer = QAction(MainWindow)
+        self.actionCheckAnswer.setObjectName(u"actionCheckAnswer")
+        self.actionClozeMode = QAction(MainWindow)
+        self.actionClozeMode.setObjectName(u"actionClozeMode")
+        self.actionClozeMode.setCheckable(True)
         self.centralwidget = QWidget(MainWindow)
         self.centralwidget.setObjectName(u"centralwidget")
         self.stackedWidget = QStackedWidget(self.centralwidget)
@@ -174,139 +190,33 @@ class Ui_MainWindow(object):
         self.actionButtonHorizontalLayout.addWidget(self.nextSampleButton)
 
         self.stackedWidget.addWidget(self.mainPage)
-        self.sampleAddPage = QWidget()
-        self.sampleAddPage.setObjectName(u"sampleAddPage")
-        self.layoutWidget = QWidget(self.sampleAddPage)
-        self.layoutWidget.setObjectName(u"layoutWidget")
-        self.layoutWidget.setGeometry(QRect(0, 60, 591, 351))
-        self.sampleAddMidPanelFormLayout = QFormLayout(self.layoutWidget)
-        self.sampleAddMidPanelFormLayout.setObjectName(u"sampleAddMidPanelFormLayout")
-        self.sampleAddMidPanelFormLayout.setHorizontalSpacing(10)
-        self.sampleAddMidPanelFormLayout.setVerticalSpacing(10)
-        self.sampleAddMidPanelFormLayout.setContentsMargins(0, 10, 0, 10)
-        self.newWordLineEdit = QLineEdit(self.layoutWidget)
-        self.newWordLineEdit.setObjectName(u"newWordLineEdit")
-        self.newWordLineEdit.setEnabled(True)
-        sizePolicy1 = QSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        sizePolicy1.setHorizontalStretch(0)
-        sizePolicy1.setVerticalStretch(0)
-        sizePolicy1.setHeightForWidth(self.newWordLineEdit.sizePolicy().hasHeightForWidth())
-        self.newWordLineEdit.setSizePolicy(sizePolicy1)
-        self.newWordLineEdit.setMinimumSize(QSize(350, 0))
-        self.newWordLineEdit.setReadOnly(False)
-
-        self.sampleAddMidPanelFormLayout.setWidget(0, QFormLayout.LabelRole, self.newWordLineEdit)
-
-        self.newWordMsgLabel = QLabel(self.layoutWidget)
-        self.newWordMsgLabel.setObjectName(u"newWordMsgLabel")
-
-        self.sampleAddMidPanelFormLayout.setWidget(0, QFormLayout.FieldRole, self.newWordMsgLabel)
-
-        self.newWordTranslateTextEdit = QTextEdit(self.layoutWidget)
-        self.newWordTranslateTextEdit.setObjectName(u"newWordTranslateTextEdit")
-        self.newWordTranslateTextEdit.setEnabled(True)
-        self.newWordTranslateTextEdit.setMinimumSize(QSize(350, 60))
-        self.newWordTranslateTextEdit.setTabChangesFocus(True)
-        self.newWordTranslateTextEdit.setReadOnly(False)
-
-        self.sampleAddMidPanelFormLayout.setWidget(1, QFormLayout.LabelRole, self.newWordTranslateTextEdit)
-
-        self.newWordTranslateMsgLabel = QLabel(self.layoutWidget)
-        self.newWordTranslateMsgLabel.setObjectName(u"newWordTranslateMsgLabel")
-        sizePolicy2 = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
-        sizePolicy2.setHorizontalStretch(0)
-        sizePolicy2.setVerticalStretch(0)
-        sizePolicy2.setHeightForWidth(self.newWordTranslateMsgLabel.sizePolicy().hasHeightForWidth())
-        self.newWordTranslateMsgLabel.setSizePolicy(sizePolicy2)
-
-        self.sampleAddMidPanelFormLayout.setWidget(1, QFormLayout.FieldRole, self.newWordTranslateMsgLabel)
-
-        self.newWordExampleEngTextEdit = QTextEdit(self.layoutWidget)
-        self.newWordExampleEngTextEdit.setObjectName(u"newWordExampleEngTextEdit")
-        self.newWordExampleEngTextEdit.setEnabled(True)
-        self.newWordExampleEngTextEdit.setMinimumSize(QSize(350, 100))
-        self.newWordExampleEngTextEdit.setTabChangesFocus(True)
-        self.newWordExampleEngTextEdit.setReadOnly(False)
-
-        self.sampleAddMidPanelFormLayout.setWidget(2, QFormLayout.LabelRole, self.newWordExampleEngTextEdit)
-
-        self.newWordExampleRusTextEdit = QTextEdit(self.layoutWidget)
-        self.newWordExampleRusTextEdit.setObjectName(u"newWordExampleRusTextEdit")
-        self.newWordExampleRusTextEdit.setEnabled(True)
-        self.newWordExampleRusTextEdit.setMinimumSize(QSize(350, 100))
-        self.newWordExampleRusTextEdit.setTabChangesFocus(True)
-        self.newWordExampleRusTextEdit.setReadOnly(False)
-
-        self.sampleAddMidPanelFormLayout.setWidget(3, QFormLayout.LabelRole, self.newWordExampleRusTextEdit)
-
-        self.newWordExampleRusMsgLabel = QLabel(self.layoutWidget)
-        self.newWordExampleRusMsgLabel.setObjectName(u"newWordExampleRusMsgLabel")
-        sizePolicy2.setHeightForWidth(self.newWordExampleRusMsgLabel.sizePolicy().hasHeightForWidth())
-        self.newWordExampleRusMsgLabel.setSizePolicy(sizePolicy2)
-
-        self.sampleAddMidPanelFormLayout.setWidget(3, QFormLayout.FieldRole, self.newWordExampleRusMsgLabel)
-
-        self.newWordExampleEngMsgLabel = QLabel(self.layoutWidget)
-        self.newWordExampleEngMsgLabel.setObjectName(u"newWordExampleEngMsgLabel")
-        sizePolicy2.setHeightForWidth(self.newWordExampleEngMsgLabel.sizePolicy().hasHeightForWidth())
-        self.newWordExampleEngMsgLabel.setSizePolicy(sizePolicy2)
-
-        self.sampleAddMidPanelFormLayout.setWidget(2, QFormLayout.FieldRole, self.newWordExampleEngMsgLabel)
-
-        self.horizontalLayoutWidget = QWidget(self.sampleAddPage)
-        self.horizontalLayoutWidget.setObjectName(u"horizontalLayoutWidget")
-        self.horizontalLayoutWidget.setGeometry(QRect(110, 420, 401, 51))
-        self.AddSamplePageBottomPanelHorizontalLayout = QHBoxLayout(self.horizontalLayoutWidget)
-        self.AddSamplePageBottomPanelHorizontalLayout.setSpacing(15)
-        self.AddSamplePageBottomPanelHorizontalLayout.setObjectName(u"AddSamplePageBottomPanelHorizontalLayout")
-        self.AddSamplePageBottomPanelHorizontalLayout.setContentsMargins(10, 5, 10, 5)
-        self.fromAddToMainPushButton = QPushButton(self.horizontalLayoutWidget)
-        self.fromAddToMainPushButton.setObjectName(u"fromAddToMainPushButton")
-
-        self.AddSamplePageBottomPanelHorizontalLayout.addWidget(self.fromAddToMainPushButton)
-
-        self.clearAddSamplePageButton = QPushButton(self.horizontalLayoutWidget)
-        self.clearAddSamplePageButton.setObjectName(u"clearAddSamplePageButton")
-
-        self.AddSamplePageBottomPanelHorizontalLayout.addWidget(self.clearAddSamplePageButton)
-
-        self.horizontalLayoutWidget_3 = QWidget(self.sampleAddPage)
-        self.horizontalLayoutWidget_3.setObjectName(u"horizontalLayoutWidget_3")
-        self.horizontalLayoutWidget_3.setGeometry(QRect(0, 0, 521, 51))
-        self.sampleAddPageTopPanelHorizontalLayout = QHBoxLayout(self.horizontalLayoutWidget_3)
-        self.sampleAddPageTopPanelHorizontalLayout.setSpacing(20)
-        self.sampleAddPageTopPanelHorizontalLayout.setObjectName(u"sampleAddPageTopPanelHorizontalLayout")
-        self.sampleAddPageTopPanelHorizontalLayout.setContentsMargins(10, 5, 10, 5)
-        self.wordZoneTitleLabel = QLabel(self.horizontalLayoutWidget_3)
-        self.wordZoneTitleLabel.setObjectName(u"wordZoneTitleLabel")
-        self.wordZoneTitleLabel.setFont(font1)
-
-        self.sampleAddPageTopPanelHorizontalLayout.addWidget(self.wordZoneTitleLabel)
-
-        self.saveNewSampleButton = QPushButton(self.horizontalLayoutWidget_3)
-        self.saveNewSampleButton.setObjectName(u"saveNewSampleButton")
-
-        self.sampleAddPageTopPanelHorizontalLayout.addWidget(self.saveNewSampleButton)
-
-        self.successful_save_label = QLabel(self.horizontalLayoutWidget_3)
-        self.successful_save_label.setObjectName(u"successful_save_label")
-        self.successful_save_label.setStyleSheet(u"QLabel { color : green; }")
-
-        self.sampleAddPageTopPanelHorizontalLayout.addWidget(self.successful_save_label)
-
-        self.stackedWidget.addWidget(self.sampleAddPage)
         MainWindow.setCentralWidget(self.centralwidget)
         self.menubar = QMenuBar(MainWindow)
         self.menubar.setObjectName(u"menubar")
         self.menubar.setGeometry(QRect(0, 0, 610, 24))
+        self.menuDeck = QMenu(self.menubar)
+        self.menuDeck.setObjectName(u"menuDeck")
+        self.menuQuiz = QMenu(self.menubar)
+        self.menuQuiz.setObjectName(u"menuQuiz")
         MainWindow.setMenuBar(self.menubar)
         self.statusbar = QStatusBar(MainWindow)
         self.statusbar.setObjectName(u"statusbar")
         MainWindow.setStatusBar(self.statusbar)
 
+        self.menubar.addAction(self.menuDeck.menuAction())
+        self.menubar.addAction(self.menuQuiz.menuAction())
+        self.menuDeck.addAction(self.actionFilterDeck)
+        self.menuDeck.addAction(self.actionShowAllWords)
+        self.menuDeck.addSeparator()
+        self.menuDeck.addAction(self.actionFrequencyOrder)
+        self.menuQuiz.addAction(self.actionQuizMode)
+        self.menuQuiz.addAction(self.actionCheckAnswer)
+        self.menuQuiz.addSeparator()
+        self.menuQuiz.addAction(self.actionClozeMode)
+
         self.retranslateUi(MainWindow)
 
-        self.stackedWidget.setCurrentIndex(1)
+        self.stackedWidget.setCurrentIndex(0)
 
 
         QMetaObject.connectSlotsByName(MainWindow)
@@ -314,6 +224,15 @@ class Ui_MainWindow(object):
 
     def retranslateUi(self, MainWindow):
         MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"Eng app", None))
+        self.actionFilterDeck.setText(QCoreApplication.translate("MainWindow", u"Filter by tags...", None))
+        self.actionShowAllWords.setText(QCoreApplication.translate("MainWindow", u"Show all words", None))
+        self.actionFrequencyOrder.setText(QCoreApplication.translate("MainWindow", u"Most frequent first", None))
+        self.actionQuizMode.setText(QCoreApplication.translate("MainWindow", u"Quiz mode", None))
+        self.actionCheckAnswer.setText(QCoreApplication.translate("MainWindow", u"Check answer", None))
+#if QT_CONFIG(shortcut)
+        self.actionCheckAnswer.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+Return", None))
+#endif // QT_CONFIG(shortcut)
+        self.actionClozeMode.setText(QCoreApplication.translate("MainWindow", u"Cloze mode", None))
         self.wordZoneLabel.setText(QCoreApplication.translate("MainWindow", u"Word and translate", None))
         self.wordLineEdit.setText("")
         self.toAddSampleButton.setText(QCoreApplication.translate("MainWindow", u"Add Sample", None))
@@ -330,21 +249,7 @@ class Ui_MainWindow(object):
         self.previousSampleButton.setText(QCoreApplication.translate("MainWindow", u"Previous Sample", None))
         self.randomSampleButton.setText(QCoreApplication.translate("MainWindow", u"Random Sample", None))
         self.nextSampleButton.setText(QCoreApplication.translate("MainWindow", u"Next Sample", None))
-#if QT_CONFIG(tooltip)
-        self.newWordLineEdit.setToolTip("")
-#endif // QT_CONFIG(tooltip)
-        self.newWordLineEdit.setText("")
-        self.newWordMsgLabel.setText(QCoreApplication.translate("MainWindow", u"Type a new word", None))
-        self.newWordTranslateTextEdit.setDocumentTitle("")
-        self.newWordTranslateMsgLabel.setText(QCoreApplication.translate("MainWindow", u"Type the word's translates", None))
-        self.newWordExampleRusMsgLabel.setText(QCoreApplication.translate("MainWindow", u"Type a translate of\n"
-"the example sentance", None))
-        self.newWordExampleEngMsgLabel.setText(QCoreApplication.translate("MainWindow", u"Type an example sentance\n"
-"that contains the word", None))
-        self.fromAddToMainPushButton.setText(QCoreApplication.translate("MainWindow", u"Back to dictionary", None))
-        self.clearAddSamplePageButton.setText(QCoreApplication.translate("MainWindow", u"Clear inputs", None))
-        self.wordZoneTitleLabel.setText(QCoreApplication.translate("MainWindow", u"Word and translate", None))
-        self.saveNewSampleButton.setText(QCoreApplication.translate("MainWindow", u"Add to dictionary", None))
-        self.successful_save_label.setText(QCoreApplication.translate("MainWindow", u"Successfully", None))
+        self.menuDeck.setTitle(QCoreApplication.translate("MainWindow", u"Deck", None))
+        self.menuQuiz.setTitle(QCoreApplication.translate("MainWindow", u"Quiz", None))
     # retranslateUi
 
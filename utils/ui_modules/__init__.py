@@ -3,3 +3,4 @@ A package contains autogenerated from .ui window modules.
 """
 
 from utils.ui_modules.Ui_MainWindow import Ui_MainWindow  # noqa
+from utils.ui_modules.Ui_AddSamplePage import Ui_AddSamplePage  # noqa
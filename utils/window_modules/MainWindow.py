@@ -1,11 +1,18 @@
 from pathlib import Path
 import sys
+from typing import Any, Callable, Tuple, Union
 
-from PySide6.QtWidgets import QMainWindow, QSizePolicy
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import (
+    QInputDialog, QLabel, QLineEdit, QMainWindow, QSizePolicy, QTextEdit,
+    QWidget)
 
 sys.path.append(Path(__file__).parents[2])
-from utils.ui_modules import Ui_MainWindow
-from utils.database_utils import Dataset, sample_type, example_dict
+from utils.ui_modules import Ui_MainWindow, Ui_AddSamplePage
+from utils.database_utils import (
+    ClozeIndex, Dataset, sample_type, grade_answer, parse_tags,
+    validate_label)
+from utils.window_modules.card_cache import CardCache
 
 
 class MainWindow(QMainWindow, Ui_MainWindow):
@@ -14,8 +21,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         super().__init__()
         self.setupUi(self)
         self.page_idxs = {
-            'main': 0,
-            'add_sample': 1
+            'main': 0
         }
         self.stackedWidget.setCurrentIndex(self.page_idxs['main'])
         self._setup_handlers()
@@ -24,20 +30,34 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         # Service variables
         self._current_sample: sample_type = self.dataset.random_choice()
         self._current_example = 0
+        # A bitmap of the samples to drill and the query it was selected by.
+        # None means all samples.
+        self._deck: int = None
+        self._deck_query: str = None
+        # Whether the answer to the current sample is checked in quiz mode
+        self._answer_checked = False
+        # Target spans of the examples, built when cloze mode is turned on
+        self._cloze_index: ClozeIndex = None
+        # Formatted cards. The neighbours of the shown card and the next
+        # random pick are formatted while the window is idle.
+        self._card_cache = CardCache(self.dataset)
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(0)
+        self._prefetch_timer.timeout.connect(self._prefetch_cards)
+        # The next random sample drawn in advance and the deck it was
+        # drawn from
+        self._next_random: sample_type = None
+        self._next_random_deck: int = None
 
         # Set up main page
         self._show_sample(self._current_sample)
 
-        # Set up add sample page
-        self.add_sample_msgs_labels = [
-            self.newWordMsgLabel, self.newWordTranslateMsgLabel,
-            self.newWordExampleEngMsgLabel, self.newWordExampleRusMsgLabel]
-        success_label_policy = QSizePolicy()
-        success_label_policy.setRetainSizeWhenHidden(True)
-        self.successful_save_label.setSizePolicy(success_label_policy)
+        # The add sample page is built on first use
+        self.add_sample_page: Ui_AddSamplePage = None
 
     def _setup_handlers(self):
-        """Setup event handlers connections."""
+        """Setup main page event handlers connections."""
         self.rightExampleButton.clicked.connect(
             self._right_example_button_click)
         self.leftExampleButton.clicked.connect(
@@ -50,13 +70,42 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             self._previous_sample_button_click)
         self.toAddSampleButton.clicked.connect(
             self._to_add_sample_button_click)
-        self.fromAddToMainPushButton.clicked.connect(
+        self.actionFilterDeck.triggered.connect(self._filter_deck_action)
+        self.actionShowAllWords.triggered.connect(
+            self._show_all_words_action)
+        self.actionQuizMode.toggled.connect(self._quiz_mode_action)
+        self.actionCheckAnswer.triggered.connect(self._check_answer_action)
+        self.actionClozeMode.toggled.connect(self._cloze_mode_action)
+        self.actionFrequencyOrder.toggled.connect(
+            self._frequency_order_action)
+
+    def _setup_add_sample_page(self):
+        """Build the add sample page and put it into the stacked widget.
+
+        The page is not needed to show the first sample, so its widgets are
+        created only when the user opens it for the first time.
+        """
+        page_widget = QWidget()
+        page = Ui_AddSamplePage()
+        page.setupUi(page_widget)
+        self.page_idxs['add_sample'] = self.stackedWidget.addWidget(
+            page_widget)
+
+        page.fromAddToMainPushButton.clicked.connect(
             self._from_add_to_main_button_click)
-        self.saveNewSampleButton.clicked.connect(
+        page.saveNewSampleButton.clicked.connect(
             self._save_new_sample_button_click)
-        self.clearAddSamplePageButton.clicked.connect(
+        page.clearAddSamplePageButton.clicked.connect(
             self._clear_add_sample_page)
 
+        self.add_sample_msgs_labels = [
+            page.newWordMsgLabel, page.newWordTranslateMsgLabel,
+            page.newWordExampleEngMsgLabel, page.newWordExampleRusMsgLabel]
+        success_label_policy = QSizePolicy()
+        success_label_policy.setRetainSizeWhenHidden(True)
+        page.successful_save_label.setSizePolicy(success_label_policy)
+        self.add_sample_page = page
+
     def _show_sample(self, sample: sample_type, example_idx: int = 0):
         """Show a given sample on this form.
 
@@ -67,66 +116,226 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         example_idx : int, optional
             An index of sample's example to show. By default is equal 0.
         """
-        word = sample['word']
-        translates = sample['translates']
-        examples = sample['examples']
+        card = self._card_cache.get(sample['word'])
 
-        self.wordLineEdit.setText(word.capitalize())
-        self.translateTextEdit.setText(', '.join(translates).capitalize())
-        self._show_example(examples[example_idx])
+        self._current_example = example_idx
+        _set_text(self.wordLineEdit, card.word)
+        if self.actionQuizMode.isChecked():
+            # The translate field becomes an input for the answer
+            self._answer_checked = False
+            self.translateTextEdit.clear()
+            self.translateTextEdit.setReadOnly(False)
+            self.translateTextEdit.setFocus()
+        else:
+            _set_text(self.translateTextEdit, card.translates)
+        self._show_example(sample, example_idx)
+        self._prefetch_timer.start()
 
-    def _show_example(self, example: example_dict):
-        """Show a given example on this form.
+    def _show_example(self, sample: sample_type, example_idx: int):
+        """Show an example of a given sample on this form.
+
+        In cloze mode the word is blanked out in the english example.
 
         Parameters
         ----------
-        example : example_dict
-            The example to show.
+        sample : sample_type
+            The sample whose example to show.
+        example_idx : int
+            An index of the sample's example to show.
         """
-        self.engExampleTextEdit.setText(example['example_eng'])
-        self.rusExampleTextEdit.setText(example['example_rus'])
+        example = sample['examples'][example_idx]
+        if self.actionClozeMode.isChecked():
+            example_eng = self._cloze_index.render(sample['word'], example_idx)
+        else:
+            example_eng = example['example_eng']
+        _set_text(self.engExampleTextEdit, example_eng)
+        _set_text(self.rusExampleTextEdit, example['example_rus'])
+
+    def _prefetch_cards(self):
+        """Format the cards that may be shown after the current one."""
+        current_word = self._current_sample['word']
+        current_idx = self.dataset.get_word_index(current_word)
+        by_frequency = self._by_frequency()
+        words = [
+            self.dataset[self.dataset.next_index(
+                current_idx, self._deck, by_frequency)],
+            self.dataset[self.dataset.previous_index(
+                current_idx, self._deck, by_frequency)]
+        ]
+        if not self._next_random_valid():
+            try:
+                self._next_random = self.dataset.random_choice(
+                    [current_word], deck=self._deck, weighted=by_frequency)
+            except IndexError:
+                self._next_random = None
+            self._next_random_deck = self._deck
+        if self._next_random is not None:
+            words.append(self._next_random)
+        self._card_cache.prefetch(sample['word'] for sample in words)
+        if self._cloze_index is not None:
+            for sample in words:
+                self._cloze_index.spans(sample['word'], 0)
+
+    def _next_random_valid(self) -> bool:
+        """Check whether the random sample drawn in advance can be shown."""
+        return (self._next_random is not None and
+                self._next_random_deck == self._deck and
+                self._next_random is not self._current_sample and
+                self._next_random['word'] in self.dataset)
 
     def _next_sample_button_click(self):
         current_idx = self.dataset.get_word_index(self._current_sample['word'])
-        current_idx = (current_idx + 1) % len(self.dataset)
+        current_idx = self.dataset.next_index(
+            current_idx, self._deck, self._by_frequency())
         sample = self.dataset[current_idx]
         self._show_sample(sample)
         self._current_sample = sample
 
     def _previous_sample_button_click(self):
         current_idx = self.dataset.get_word_index(self._current_sample['word'])
-        current_idx = (current_idx - 1) % len(self.dataset)
+        current_idx = self.dataset.previous_index(
+            current_idx, self._deck, self._by_frequency())
         sample = self.dataset[current_idx]
         self._show_sample(sample)
         self._current_sample = sample
 
     def _random_sample_button_click(self):
-        current_word = self._current_sample['word']
-        sample = self.dataset.random_choice([current_word])
+        if self._next_random_valid():
+            sample = self._next_random
+            self._next_random = None
+        else:
+            current_word = self._current_sample['word']
+            try:
+                sample = self.dataset.random_choice(
+                    [current_word], deck=self._deck,
+                    weighted=self._by_frequency())
+            except IndexError:
+                # The current sample is the only one in the deck
+                return
         self._show_sample(sample)
         self._current_sample = sample
 
+    def _by_frequency(self) -> bool:
+        """Whether samples are walked and drawn by frequency.
+
+        Adding a word to a sharded dataset drops its frequency ranks,
+        and then the usual order is used again.
+        """
+        return (self.actionFrequencyOrder.isChecked() and
+                self.dataset.frequency_ranks is not None)
+
+    def _frequency_order_action(self, checked: bool):
+        if checked and self.dataset.frequency_ranks is None:
+            self.actionFrequencyOrder.setChecked(False)
+            self.statusbar.showMessage(
+                'The words are not ranked, run scripts/rank_words.py')
+            return
+        # The random sample drawn in advance used the other weighting
+        self._next_random = None
+        self._prefetch_timer.start()
+
+    def _quiz_mode_action(self, checked: bool):
+        self.translateTextEdit.setReadOnly(True)
+        self.translateTextEdit.setPlaceholderText(
+            'Type the translate and press Ctrl+Enter' if checked else '')
+        self._show_sample(self._current_sample, self._current_example)
+
+    def _cloze_mode_action(self, checked: bool):
+        if checked and self._cloze_index is None:
+            self._cloze_index = ClozeIndex(self.dataset)
+        self._show_example(self._current_sample, self._current_example)
+
+    def _check_answer_action(self):
+        if not self.actionQuizMode.isChecked() or self._answer_checked:
+            return
+        answer = self.translateTextEdit.toPlainText()
+        translates = self._current_sample['translates']
+        grade = grade_answer(answer, translates)
+        if grade.correct and grade.distance == 0:
+            message = 'Correct!'
+        elif grade.correct:
+            message = f'Correct, but with a typo: "{grade.expected}"'
+        else:
+            message = f'Wrong, your answer was "{answer.strip()}"'
+        self.statusbar.showMessage(message)
+
+        self._answer_checked = True
+        self.translateTextEdit.setReadOnly(True)
+        card = self._card_cache.get(self._current_sample['word'])
+        _set_text(self.translateTextEdit, card.translates)
+
+    def _filter_deck_action(self):
+        query, ok = QInputDialog.getText(
+            self, 'Filter by tags',
+            'Tags query, e.g. "ml & !deck:archive" or "(ml | cv) & week":',
+            text=self._deck_query or '')
+        if not ok or query.strip() == '':
+            return
+        try:
+            deck = self.dataset.select(query)
+        except ValueError as error:
+            self.statusbar.showMessage(str(error))
+            return
+        if deck == 0:
+            self.statusbar.showMessage(f'No words match "{query}".')
+            return
+        self._set_deck(deck, query)
+
+    def _show_all_words_action(self):
+        self._set_deck(None, None)
+
+    def _set_deck(self, deck: int, query: str):
+        """Restrict drilling to a deck of samples.
+
+        Parameters
+        ----------
+        deck : int
+            A bitmap of sample indexes or `None` for all samples.
+        query : str
+            The deck query the bitmap was selected by.
+        """
+        self._deck = deck
+        self._deck_query = query
+        # The random sample drawn in advance may be out of the new deck
+        self._next_random = None
+        if deck is None:
+            self.statusbar.clearMessage()
+            return
+        self.statusbar.showMessage(
+            f'Deck "{query}": {deck.bit_count()} words')
+        current_idx = self.dataset.get_word_index(self._current_sample['word'])
+        if not deck >> current_idx & 1:
+            self._current_sample = self.dataset.random_choice(deck=deck)
+            self._show_sample(self._current_sample)
+
     def _right_example_button_click(self):
         examples = self._current_sample['examples']
         self._current_example = (self._current_example + 1) % len(examples)
-        self._show_example(examples[self._current_example])
+        self._show_example(self._current_sample, self._current_example)
 
     def _left_example_button_click(self):
         examples = self._current_sample['examples']
         self._current_example = (self._current_example - 1) % len(examples)
-        self._show_example(examples[self._current_example])
+        self._show_example(self._current_sample, self._current_example)
 
     def _clear_add_sample_page(self):
+        page = self.add_sample_page
         for label in self.add_sample_msgs_labels:
             label.setStyleSheet('QLabel { font-size: 12pt; color : black; }')
-        for text_input in [self.newWordLineEdit,
-                           self.newWordTranslateTextEdit,
-                           self.newWordExampleEngTextEdit,
-                           self.newWordExampleRusTextEdit]:
+        for text_input in [page.newWordLineEdit,
+                           page.newWordTranslateTextEdit,
+                           page.newWordExampleEngTextEdit,
+                           page.newWordExampleRusTextEdit,
+                           page.newWordTagsLineEdit,
+                           page.newWordDeckLineEdit]:
             text_input.clear()
-        self.successful_save_label.setVisible(False)
+        for label in [page.newWordTagsMsgLabel, page.newWordDeckMsgLabel]:
+            label.setStyleSheet('QLabel { font-size: 12pt; color : black; }')
+        page.successful_save_label.setVisible(False)
         
     def _to_add_sample_button_click(self):
+        if self.add_sample_page is None:
+            self._setup_add_sample_page()
         self._clear_add_sample_page()
         self.stackedWidget.setCurrentIndex(self.page_idxs['add_sample'])
 
@@ -134,10 +343,11 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.stackedWidget.setCurrentIndex(self.page_idxs['main'])
 
     def _save_new_sample_button_click(self):
-        word = self.newWordLineEdit.text()
-        translate = self.newWordTranslateTextEdit.toPlainText()
-        example_eng = self.newWordExampleEngTextEdit.toPlainText()
-        example_rus = self.newWordExampleRusTextEdit.toPlainText()
+        page = self.add_sample_page
+        word = page.newWordLineEdit.text()
+        translate = page.newWordTranslateTextEdit.toPlainText()
+        example_eng = page.newWordExampleEngTextEdit.toPlainText()
+        example_rus = page.newWordExampleRusTextEdit.toPlainText()
         
         correct = True
         for text, label in zip([word, translate, example_eng, example_rus],
@@ -148,25 +358,85 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             else:
                 label.setStyleSheet(
                     'QLabel { font-size: 12pt; color : black; }')
+
+        # Tags and the deck are optional but must be usable in deck queries
+        tags_correct, tags = self._parse_optional_input(
+            parse_tags, page.newWordTagsLineEdit, page.newWordTagsMsgLabel)
+        deck_correct, deck = self._parse_optional_input(
+            validate_label, page.newWordDeckLineEdit,
+            page.newWordDeckMsgLabel)
+        correct = correct and tags_correct and deck_correct
         
         if correct:
             word = word.strip().capitalize()
-            self.newWordLineEdit.setText(word)
+            page.newWordLineEdit.setText(word)
             word = word.lower()
             translate = translate.strip()
-            self.newWordTranslateTextEdit.setText(translate)
+            page.newWordTranslateTextEdit.setText(translate)
             translate = [trans.strip().lower()
                          for trans in translate.split(',')]
             example_eng = example_eng.strip()
-            self.newWordExampleEngTextEdit.setText(example_eng)
+            page.newWordExampleEngTextEdit.setText(example_eng)
             example_rus = example_rus.strip()
-            self.newWordExampleRusTextEdit.setText(example_rus)
+            page.newWordExampleRusTextEdit.setText(example_rus)
 
-            self.dataset.add_sample(word, translate, example_eng, example_rus)
-            self.successful_save_label.setVisible(True)
+            self.dataset.add_sample(word, translate, example_eng, example_rus,
+                                    tags, deck)
+            if self._deck is not None:
+                # Adding may shift sample indexes of the deck's bitmap
+                self._deck = self.dataset.select(self._deck_query)
+            # The random sample drawn in advance ignores the new word and
+            # the deck it was drawn from may have shifted
+            self._next_random = None
+            page.successful_save_label.setVisible(True)
             # Show new sample on main page
             self._current_sample = self.dataset[word]
             self._show_sample(self._current_sample)
 
+    def _parse_optional_input(
+        self,
+        parse: Callable[[str], Any],
+        text_input: QLineEdit,
+        label: QLabel
+    ) -> Tuple[bool, Any]:
+        """Parse an optional input of the add sample page.
+
+        Parameters
+        ----------
+        parse : Callable[[str], Any]
+            A function that parses the input's text or raises `ValueError`.
+        text_input : QLineEdit
+            The input.
+        label : QLabel
+            The input's label that turns red if the text is malformed.
+
+        Returns
+        -------
+        Tuple[bool, Any]
+            Whether the text is correct and the parsed value, `None`
+            for an empty input.
+        """
+        text = text_input.text().strip()
+        try:
+            value = parse(text) if text else None
+        except ValueError as error:
+            label.setStyleSheet('QLabel { font-size: 12pt; color : red; }')
+            self.statusbar.showMessage(str(error))
+            return False, None
+        label.setStyleSheet('QLabel { font-size: 12pt; color : black; }')
+        return True, value
+
     def closeEvent(self, close_event):
-        self.dataset.save_dataset(Path(sys.argv[0]).parent / 'words.json')
+        self.dataset.save_dataset(self.dataset.dataset_path)
+
+
+def _set_text(widget: Union[QLineEdit, QTextEdit], text: str):
+    """Set a text of a line or text edit only if it differs from the shown one.
+
+    Setting a text relayouts the widget even if the text is the same.
+    """
+    if isinstance(widget, QLineEdit):
+        if widget.text() != text:
+            widget.setText(text)
+    elif widget.toPlainText() != text:
+        widget.setPlainText(text)
@@ -0,0 +1,86 @@
+"""A module with a cache of formatted card content for the main window."""
+
+from collections import OrderedDict
+from typing import Iterable, NamedTuple
+
+from utils.database_utils import Dataset
+
+
+class CardContent(NamedTuple):
+    """Texts of a card as they are shown on the main page."""
+    word: str
+    translates: str
+
+
+class CardCache:
+    """A bounded LRU cache of formatted cards of a dataset.
+
+    Cards are keyed by words rather than sample indexes because adding
+    a sample to a sharded dataset shifts the indexes of the following ones.
+    A card is dropped when its sample is changed.
+    """
+
+    def __init__(self, dataset: Dataset, max_size: int = 256) -> None:
+        """Create an empty cache.
+
+        Parameters
+        ----------
+        dataset : Dataset
+            The dataset whose cards to format.
+        max_size : int, optional
+            The maximum number of cached cards. By default is equal 256.
+        """
+        self.dataset = dataset
+        self.max_size = max_size
+        self._cards: OrderedDict[str, CardContent] = OrderedDict()
+        dataset.add_change_listener(self.invalidate)
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._cards
+
+    def get(self, word: str) -> CardContent:
+        """Get a formatted card formatting it if it is not cached.
+
+        Parameters
+        ----------
+        word : str
+            The word of the card's sample.
+
+        Returns
+        -------
+        CardContent
+            The card.
+        """
+        card = self._cards.get(word)
+        if card is None:
+            card = format_card(self.dataset[word])
+            self._cards[word] = card
+            if len(self._cards) > self.max_size:
+                self._cards.popitem(last=False)
+        else:
+            self._cards.move_to_end(word)
+        return card
+
+    def prefetch(self, words: Iterable[str]):
+        """Format cards that are likely to be shown next.
+
+        Parameters
+        ----------
+        words : Iterable[str]
+            The words of the cards.
+        """
+        for word in words:
+            self.get(word)
+
+    def invalidate(self, word: str):
+        """Drop a card after its sample was changed."""
+        self._cards.pop(word, None)
+
+
+def format_card(sample: dict) -> CardContent:
+    """Format the texts of a sample's card."""
+    return CardContent(sample['word'].capitalize(),
+                       ', '.join(sample['translates']).capitalize())